@@ -3,36 +3,266 @@ CSV to Google Sheets Automation Script
 Reads daily CSV files from a subfolder and uploads them to Google Sheets 'daily ops' sheet.
 """
 
-import pandas as pd
+from __future__ import annotations
+
+import argparse
+import functools
 import os
 import time
 import json
+import random
 import re
 import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
-import gspread
-from google.oauth2.service_account import Credentials as ServiceAccountCredentials
-from google.oauth2.credentials import Credentials as OAuthCredentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from google.auth.exceptions import GoogleAuthError
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
-import pickle
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import sys
-from openpyxl import load_workbook
-from openpyxl.utils import get_column_letter, column_index_from_string
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+import importlib
+import importlib.util
+
+
+class _LazyModule:
+    """Stand-in for a module that is only imported on first attribute access.
+
+    pandas alone costs ~0.5-1s to import; deferring it keeps validation-only
+    and dry-run invocations fast. The Google and openpyxl imports are likewise
+    done inside the methods that need them. The deferred import is an ordinary
+    import (guarded by the import lock), so worker threads may trigger it.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr: str):
+        value = getattr(importlib.import_module(self._name), attr)
+        # Cache on the stand-in so later lookups skip __getattr__
+        setattr(self, attr, value)
+        return value
+
+
+def _lazy_import(name: str):
+    """Return the module if it is already imported, otherwise a lazy stand-in."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name)
+
+
+pd = _lazy_import("pandas")
+gspread = _lazy_import("gspread")
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# orjson is optional; it parses/serializes several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON text, using orjson when it is installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes (unknown types via str), using orjson when installed."""
+    if orjson:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+# A folder modified this recently may still change within the same mtime tick
+# (FAT/SMB timestamps are coarse), so its listing is not cached yet
+_DIR_LISTING_SETTLE_NS = 5_000_000_000
+
+
+def _read_dir(root: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return (all entry names, subfolder names) of root from a single scandir pass."""
+    names, dirs = [], []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            names.append(entry.name)
+            if entry.is_dir():
+                dirs.append(entry.name)
+    return tuple(names), tuple(dirs)
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_dir(root: str, mtime_ns: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Cached _read_dir, keyed on the folder's mtime so a listing is reused
+    until entries are added or removed."""
+    return _read_dir(root)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_json_file(path: str, mtime_ns: int, encoding: Optional[str] = None):
+    """Parse a JSON file, reusing the result until its mtime changes."""
+    with open(path, 'r', encoding=encoding) as f:
+        return _json_loads(f.read())
+
+
+def _load_json(path, encoding: Optional[str] = None):
+    """Return a private copy of a JSON file's contents (callers may mutate it)."""
+    path = os.fspath(path)
+    return deepcopy(_parse_json_file(path, os.stat(path).st_mtime_ns, encoding))
 
 # Fix Windows encoding issues - use ASCII-safe characters
 CHECKMARK = "[OK]" if sys.platform == 'win32' else "{CHECKMARK}"
 WARNING = "[!]" if sys.platform == 'win32' else "⚠"
 CROSS = "[X]" if sys.platform == 'win32' else "{CROSS}"
 
+# SalesSummary_YYYY-MM-DD_YYYY-MM-DD: groups are the second (input) date
+_SALES_INPUT_DATE_RE = re.compile(r'SalesSummary_\d{4}-\d{2}-\d{2}_(\d{4})-(\d{2})-(\d{2})')
+# PayrollExport_YYYY_MM_DD-YYYY_MM_DD.csv (second date) and PayrollExport_YYYY_MM_DD.csv
+_PAYROLL_TWO_DATES_RE = re.compile(r'PayrollExport_\d{4}_\d{2}_\d{2}-(\d{4})_(\d{2})_(\d{2})')
+_PAYROLL_SINGLE_DATE_RE = re.compile(r'PayrollExport_(\d{4})_(\d{2})_(\d{2})\.csv')
+# Dates embedded in CSV file names, tried in order: (compiled pattern, group order)
+_SLASH_DATE_RE = re.compile(r'(\d{2})/(\d{2})/(\d{4})')
+_FILENAME_DATE_PATTERNS = (
+    (re.compile(r'(\d{4})-(\d{2})-(\d{2})'), "ymd"),  # 2026-01-06
+    (re.compile(r'(\d{8})'), "compact"),  # 20260106
+    (_SLASH_DATE_RE, "mdy"),  # 01/06/2026
+    (_SLASH_DATE_RE, "dmy"),  # 06/01/2026
+)
+
+# Folder-name date patterns, tried in order: (compiled pattern, group order)
+_FOLDER_DATE_PATTERNS = (
+    (re.compile(r'SalesSummary_(\d{4})-(\d{2})-(\d{2})_\d{4}-\d{2}-\d{2}'), "ymd"),  # SalesSummary_2025-12-31_2025-12-31
+    # Legacy patterns for backward compatibility
+    (re.compile(r'daily_data_(\d{2})_(\d{2})_(\d{4})'), "mdy"),  # daily_data_01_07_2025
+    (re.compile(r'daily_data_(\d{2})-(\d{2})-(\d{4})'), "mdy"),  # daily_data_01-07-2025
+    (re.compile(r'daily_data(\d{8})'), "compact"),  # daily_data01072025
+)
+
+
+def _extract_date(text: str, patterns=_FOLDER_DATE_PATTERNS) -> Optional[datetime]:
+    """Extract the date from a folder name (SalesSummary or legacy daily_data),
+    or from any text using another (pattern, order) table.
+    The regex groups are fixed-width digits, so the date is built from ints
+    directly rather than re-parsed with strptime."""
+    for pattern, order in patterns:
+        match = pattern.search(text)
+        if not match:
+            continue
+        try:
+            if order == "ymd":
+                year, month, day = match.groups()
+            elif order == "mdy":
+                month, day, year = match.groups()
+            elif order == "dmy":
+                day, month, year = match.groups()
+            else:
+                digits = match.group(1)
+                return datetime(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_sales_summary_input_date(name: str) -> Optional[datetime]:
+    """Input (second) date of a SalesSummary_YYYY-MM-DD_YYYY-MM-DD name, or None."""
+    match = _SALES_INPUT_DATE_RE.search(name)
+    if not match:
+        return None
+    year, month, day = match.groups()
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _normalize_date_cells(values) -> "Set[str]":
+    """Normalize Date column cells to a set of YYYY-MM-DD strings.
+    Each distinct value is parsed once, and all the strings go through a single
+    pd.to_datetime call; cells that are not dates are kept as stripped text."""
+    result = set()
+    texts = []
+    for value in dict.fromkeys(values):
+        if value is pd.NaT:
+            continue
+        if isinstance(value, datetime):
+            result.add(value.date().isoformat())
+        else:
+            texts.append(str(value))
+    if not texts:
+        return result
+    try:
+        parsed = pd.to_datetime(pd.Series(texts), errors="coerce", format="mixed")
+        pairs = zip(texts, parsed)
+    except Exception:
+        # e.g. mixed timezone offsets: fall back to parsing each cell on its own
+        pairs = []
+        for text in texts:
+            try:
+                pairs.append((text, pd.to_datetime(text)))
+            except Exception:
+                pairs.append((text, pd.NaT))
+    for text, stamp in pairs:
+        date_str = text.strip() if pd.isna(stamp) else stamp.date().isoformat()
+        if date_str:
+            result.add(date_str)
+    return result
+
+
+def _first_category_positions(values: "pd.Series", categories: List, separators: str) -> Dict:
+    """Position of the first row matching each category, or None.
+    Tries an exact match on the stripped text, then a case-insensitive one, then
+    the first row containing any word (longer than 2 chars) of the category name,
+    with separators treated as spaces. The column is normalized once and the
+    exact/case-insensitive matches are dict lookups instead of per-category scans."""
+    stripped = values.astype(str).str.strip()
+    exact, folded = {}, {}
+    for pos, (text, text_lower) in enumerate(zip(stripped, stripped.str.lower())):
+        exact.setdefault(text, pos)
+        folded.setdefault(text_lower, pos)
+    raw_lower = None
+    positions = {}
+    for category in categories:
+        category_clean = str(category).strip()
+        pos = exact.get(category_clean)
+        if pos is None:
+            pos = folded.get(category_clean.lower())
+        if pos is None:
+            words = category_clean.lower()
+            for sep in separators:
+                words = words.replace(sep, ' ')
+            for word in words.split():
+                if len(word) > 2:
+                    if raw_lower is None:
+                        raw_lower = values.astype(str).str.lower()
+                    matches = raw_lower.str.contains(word, na=False, regex=False).to_numpy()
+                    if matches.any():
+                        pos = int(matches.argmax())
+                        break
+        positions[category] = pos
+    return positions
+
+
+@functools.lru_cache(maxsize=None)
+def _column_letter(col_idx: int) -> str:
+    """A1 column letters for a 1-based column index (1 -> A, 27 -> AA); memoized."""
+    col_letter = ''
+    col_num = col_idx
+    while col_num > 0:
+        col_num, remainder = divmod(col_num - 1, 26)
+        col_letter = chr(ord('A') + remainder) + col_letter
+    return col_letter
+
+
+def _retry_after_seconds(headers) -> float:
+    """Seconds from a Retry-After response header, or 0 if absent or not a number."""
+    if not headers:
+        return 0.0
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
 
 def render_progress(label: str, current: int, total: int, width: int = 20, thickness: int = 5) -> None:
     if total <= 0:
@@ -48,11 +278,40 @@ def render_progress(label: str, current: int, total: int, width: int = 20, thick
     if current >= total:
         sys.stdout.write("\n")
 
+_stdout_lock = threading.Lock()
+
+
+def print_banner(title: str, *lines: str, width: int = 70) -> None:
+    """Print a section banner (plus any extra lines) as one write, so it
+    cannot interleave with output from worker threads."""
+    rule = "=" * width
+    text = f"\n{rule}\n{title}\n{rule}\n" + "".join(f"{line}\n" for line in lines)
+    with _stdout_lock:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
 # Default Google Drive folder IDs for production input sources
 DRIVE_INPUT_ROOT_ID = "1fr63Bo6L7RBa3ID_shGWFM88SZI6xuPM"
 DRIVE_SALES_INPUT_ID = "1JLIW_mG0xR-Ny0onSNt_QLTAuPsT7wDJ"
 DRIVE_LABOR_INPUT_ID = "1JNHcL1SWNtp7ypQXsUWtCGp53z97UHzD"
 
+# Interactive menu choices 1-12 as (process_type, week_type, mode_type)
+MENU_CHOICES = (
+    ("sales", "latest", "testing"),
+    ("sales", "oldest", "testing"),
+    ("sales", "latest", "production"),
+    ("sales", "oldest", "production"),
+    ("labor", "latest", "testing"),
+    ("labor", "oldest", "testing"),
+    ("labor", "latest", "production"),
+    ("labor", "oldest", "production"),
+    ("all", "latest", "testing"),
+    ("all", "oldest", "testing"),
+    ("all", "latest", "production"),
+    ("all", "oldest", "production"),
+)
+
 class CSVToSheetsAutomation:
     def __init__(self, config_path: str = "config.json", dry_run: bool = False, process_oldest: bool = False, mode_override: Optional[bool] = None):
         """Initialize the automation with configuration file.
@@ -87,11 +346,16 @@ class CSVToSheetsAutomation:
         self.worksheet = None
         self.workbook = None
         self.creds = None
-        self.drive_service = None
+        self._drive_local = threading.local()
         self._drive_sales_cache_path = None
         self._drive_labor_cache_path = None
         self.worksheet_cache = {}
+        self._worksheet_index_loaded = False
         self.sheet_headers_cache = {}
+        self.date_values_cache = {}
+        self.existing_dates_cache = {}
+        self._csv_prefetch = {}
+        self._workbook_dirty = False
         self.excel_worksheet = None
         self.excel_file_path = None
         self.using_test_sheet = False
@@ -109,15 +373,13 @@ class CSVToSheetsAutomation:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file {config_path} not found!")
         
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = _load_json(config_path)
         
         # Load secrets.json if it exists (contains sensitive data like Sheet ID and email)
         secrets_path = Path(__file__).parent / "secrets.json"
         if secrets_path.exists():
             try:
-                with open(secrets_path, 'r', encoding='utf-8-sig') as f:
-                    secrets = json.load(f)
+                secrets = _load_json(secrets_path, encoding='utf-8-sig')
                 
                 # Merge Sheet ID from secrets if provided
                 if 'google_sheet_id' in secrets and secrets['google_sheet_id'] != 'YOUR_GOOGLE_SHEET_ID_HERE':
@@ -177,14 +439,19 @@ class CSVToSheetsAutomation:
             return {}
         
         try:
-            with open(csv_structure_path, 'r', encoding='utf-8') as f:
-                structure = json.load(f)
+            structure = _load_json(csv_structure_path, encoding='utf-8')
             return structure.get('csv_files', {})
         except Exception as e:
             return {}
     
     def authenticate_google_sheets(self) -> bool:
         """Authenticate with Google Sheets API using service account or OAuth."""
+        from google.auth.exceptions import GoogleAuthError
+        
+        if self.gc and self.sheet:
+            # Reuse the authorized client (and its open HTTP session) across steps
+            return True
+
         auth_method = self.config.get('auth_method', 'service_account').lower()
         
         scope = [
@@ -243,39 +510,27 @@ class CSVToSheetsAutomation:
                     except Exception as e2:
                         print(f"  Method 1 (URL) failed: {e2}")
                         
-                        # Method 2: Try listing all sheets and finding by ID
+                        # Method 2: Look the file up directly in Drive to confirm it exists and is shared
                         try:
-                            print(f"  Trying Method 2: Listing accessible sheets...")
-                            all_sheets = self.gc.openall()
-                            print(f"  Found {len(all_sheets)} accessible sheet(s)")
-                            
-                            # Show first few sheets for debugging
-                            print(f"  Sample of accessible sheets:")
-                            for i, sheet in enumerate(all_sheets[:5], 1):
-                                print(f"    {i}. {sheet.title} (ID: {sheet.id[:20]}...)")
-                            
-                            # Try to find by ID
-                            found = False
-                            for sheet in all_sheets:
-                                if sheet.id == sheet_id:
-                                    self.sheet = sheet
-                                    print(f"{CHECKMARK} Found sheet by listing: {self.sheet.title}")
-                                    found = True
-                                    break
+                            print(f"  Trying Method 2: Checking sheet access through Drive...")
+                            file_info = self._retry_drive(
+                                self._get_drive_service().files().get(
+                                    fileId=sheet_id,
+                                    fields="id, name, capabilities(canEdit)",
+                                    supportsAllDrives=True
+                                ).execute
+                            )
+                            can_edit = file_info.get("capabilities", {}).get("canEdit")
+                            print(f"  Drive can see: {file_info.get('name')} (edit access: {'yes' if can_edit else 'no'})")
                             
-                            if not found:
-                                # Also try partial match (in case of formatting issues)
-                                for sheet in all_sheets:
-                                    if sheet.id.replace('-', '') == sheet_id.replace('-', ''):
-                                        self.sheet = sheet
-                                        print(f"{CHECKMARK} Found sheet by partial ID match: {self.sheet.title}")
-                                        found = True
-                                        break
-                                
-                                if not found:
-                                    raise Exception(f"Sheet with ID {sheet_id} not found in {len(all_sheets)} accessible sheets")
+                            # The file is reachable, so retry once with freshly refreshed credentials
+                            if hasattr(creds, "refresh"):
+                                from google.auth.transport.requests import Request
+                                creds.refresh(Request())
+                            self.sheet = self.gc.open_by_key(sheet_id)
+                            print(f"{CHECKMARK} Successfully opened Google Sheet after refresh: {self.sheet.title}")
                         except Exception as e3:
-                            print(f"  Method 2 (listing) failed: {e3}")
+                            print(f"  Method 2 (Drive lookup) failed: {e3}")
                             print(f"\n💡 SOLUTION: Add your account as a test user in Google Cloud Console:")
                             print(f"  1. Go to: https://console.cloud.google.com/apis/credentials/consent")
                             print(f"  2. Click 'Edit App'")
@@ -293,7 +548,7 @@ class CSVToSheetsAutomation:
                     print(f"  2. Verify the Sheet ID is correct: {sheet_id}")
                     print(f"  3. Check that the sheet is shared with the authorized account")
                     print(f"  4. Try opening the sheet in your browser to verify access")
-                    print(f"  5. Delete token.pickle and re-run to re-authenticate with correct account")
+                    print(f"  5. Delete token.json and re-run to re-authenticate with correct account")
                     return False
             
             # No worksheet needed - CSV processing functions access tabs directly by name
@@ -310,6 +565,7 @@ class CSVToSheetsAutomation:
     
     def _authenticate_service_account(self, scope: List[str]):
         """Authenticate using service account credentials."""
+        from google.oauth2.service_account import Credentials as ServiceAccountCredentials
         credentials_path = self.config.get('credentials_file', 'credentials.json')
         
         if not os.path.exists(credentials_path):
@@ -326,7 +582,13 @@ class CSVToSheetsAutomation:
     
     def _authenticate_oauth(self, scope: List[str]):
         """Authenticate using OAuth 2.0 flow."""
-        token_path = self.config.get('oauth_token_file', 'token.pickle')
+        from google.oauth2.credentials import Credentials as OAuthCredentials
+        from google.auth.transport.requests import Request
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        
+        # Tokens are stored as JSON next to the configured (legacy pickle) path
+        legacy_token_path = Path(self.config.get('oauth_token_file', 'token.pickle'))
+        token_path = legacy_token_path.with_suffix('.json')
         
         # Check if OAuth credentials are in secrets.json first
         oauth_credentials = self.config.get('_oauth_credentials')
@@ -344,18 +606,27 @@ class CSVToSheetsAutomation:
                 return None
         
         creds = None
+        migrate_legacy_token = False
         
         # Load existing token if available
-        if os.path.exists(token_path):
+        if token_path.exists():
+            try:
+                creds = OAuthCredentials.from_authorized_user_file(str(token_path), scope)
+            except Exception as e:
+                print(f"Warning: Could not load existing token: {e}")
+        elif legacy_token_path != token_path and legacy_token_path.exists():
+            # One-time migration of a token saved by older versions
             try:
-                with open(token_path, 'rb') as token:
+                import pickle
+                with open(legacy_token_path, 'rb') as token:
                     creds = pickle.load(token)
+                migrate_legacy_token = True
             except Exception as e:
                 print(f"Warning: Could not load existing token: {e}")
         
         # If there are no (valid) credentials available, let the user log in
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
+        if not creds or not creds.valid or migrate_legacy_token:
+            if creds and not creds.valid and creds.expired and creds.refresh_token:
                 # Refresh the token
                 try:
                     creds.refresh(Request())
@@ -379,8 +650,9 @@ class CSVToSheetsAutomation:
             
             # Save the credentials for the next run
             try:
-                with open(token_path, 'wb') as token:
-                    pickle.dump(creds, token)
+                token_path.write_text(creds.to_json())
+                if migrate_legacy_token:
+                    legacy_token_path.unlink()
                 print("{CHECKMARK} OAuth token saved for future use")
             except Exception as e:
                 print(f"Warning: Could not save token: {e}")
@@ -388,18 +660,38 @@ class CSVToSheetsAutomation:
         return creds
     
     def _get_drive_service(self):
-        """Build and cache a Google Drive service client."""
-        if self.drive_service:
-            return self.drive_service
+        """Build and cache a Google Drive service client.
+        One client per thread, since the underlying httplib2 connection is not thread-safe."""
+        service = getattr(self._drive_local, "service", None)
+        if service:
+            return service
         if not self.creds:
             raise RuntimeError("Google credentials not initialized. Run authenticate_google_sheets first.")
-        self.drive_service = build("drive", "v3", credentials=self.creds, cache_discovery=False)
-        return self.drive_service
+        from googleapiclient.discovery import build
+        service = build("drive", "v3", credentials=self.creds, cache_discovery=False)
+        self._drive_local.service = service
+        return service
+
+    def _compute_backoff(self, attempt: int, max_retries: int, base_delay: float, max_delay: float,
+                         headers, started: float) -> Optional[float]:
+        """Return how long to wait before retrying, or None to give up.
+        Honors the server's Retry-After, adds jitter so parallel callers don't retry in
+        lockstep, and stops once retry_budget_seconds would be exceeded."""
+        if attempt + 1 >= max_retries:
+            return None
+        delay = max(min(base_delay * (2 ** attempt), max_delay), _retry_after_seconds(headers))
+        delay += random.uniform(0, 1)
+        if time.monotonic() - started + delay > self.config.get('retry_budget_seconds', 300):
+            return None
+        return delay
 
-    def _retry_drive(self, func, *args, **kwargs):
-        """Retry Google Drive calls when rate-limited."""
+    def _retry_drive(self, func, *args, log: Callable[[str], None] = print, **kwargs):
+        """Retry Google Drive calls when rate-limited. Retry notices go to log."""
+        from googleapiclient.errors import HttpError
         max_retries = self.config.get('drive_max_retries', 5)
         base_delay = self.config.get('drive_retry_base_seconds', 5)
+        max_delay = self.config.get('drive_retry_max_seconds', 64)
+        started = time.monotonic()
 
         last_exception = None
         for attempt in range(max_retries):
@@ -419,49 +711,64 @@ class CSVToSheetsAutomation:
                 )
                 if not is_rate_limit:
                     raise
-                delay = base_delay * (2 ** attempt)
-                print(f"  {WARNING} Drive rate limit hit. Retrying in {delay} seconds...")
+                delay = self._compute_backoff(attempt, max_retries, base_delay, max_delay,
+                                              getattr(e, "resp", None), started)
+                if delay is None:
+                    raise
+                log(f"  {WARNING} Drive rate limit hit. Retrying in {delay:.0f} seconds...")
                 time.sleep(delay)
 
         if last_exception:
             raise last_exception
         raise RuntimeError("Drive rate limit retries exhausted")
     
-    def _list_drive_children(self, folder_id: str) -> List[Dict]:
+    def _list_drive_children(self, folder_id: str, log: Callable[[str], None] = print) -> List[Dict]:
         """List files and folders inside a Google Drive folder."""
+        return list(self._iter_drive_children(folder_id, log))
+    
+    def _iter_drive_children(self, folder_id: str, log: Callable[[str], None] = print):
+        """Yield files and folders inside a Google Drive folder as each page arrives."""
         service = self._get_drive_service()
-        items = []
         page_token = None
         
         while True:
             response = self._retry_drive(
                 service.files().list(
                     q=f"'{folder_id}' in parents and trashed=false",
-                    fields="nextPageToken, files(id, name, mimeType)",
+                    fields="nextPageToken, files(id, name, mimeType, modifiedTime, md5Checksum, size)",
                     pageToken=page_token
-                ).execute
+                ).execute,
+                log=log,
             )
-            items.extend(response.get("files", []))
+            yield from response.get("files", [])
             page_token = response.get("nextPageToken")
             if not page_token:
                 break
-        
-        return items
     
-    def _download_drive_file(self, file_id: str, dest_path: Path) -> None:
-        """Download a file from Google Drive to a local path."""
+    def _download_drive_file(self, file_id: str, dest_path: Path, skip_mkdir: bool = False,
+                             log: Callable[[str], None] = print) -> None:
+        """Download a file from Google Drive to a local path.
+        Pass skip_mkdir=True when the caller has already created the parent folder."""
+        from googleapiclient.errors import HttpError
+        from googleapiclient.http import MediaIoBaseDownload
+        
         service = self._get_drive_service()
         max_retries = self.config.get('drive_max_retries', 5)
         base_delay = self.config.get('drive_retry_base_seconds', 5)
+        max_delay = self.config.get('drive_retry_max_seconds', 64)
+        started = time.monotonic()
+        # MediaIoBaseDownload defaults to 100 KB per ranged GET; most exports fit in one chunk
+        chunk_bytes = self.config.get('drive_chunk_bytes', 8 * 1024 * 1024)
 
         last_exception = None
         for attempt in range(max_retries):
             try:
                 request = service.files().get_media(fileId=file_id)
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                if not skip_mkdir:
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
 
                 with open(dest_path, "wb") as f:
-                    downloader = MediaIoBaseDownload(f, request)
+                    downloader = MediaIoBaseDownload(f, request, chunksize=chunk_bytes)
                     done = False
                     while not done:
                         _, done = downloader.next_chunk()
@@ -485,33 +792,110 @@ class CSVToSheetsAutomation:
                 )
                 if not is_rate_limit:
                     raise
-                delay = base_delay * (2 ** attempt)
-                print(f"  {WARNING} Drive rate limit hit. Retrying in {delay} seconds...")
+                delay = self._compute_backoff(attempt, max_retries, base_delay, max_delay,
+                                              getattr(e, "resp", None), started)
+                if delay is None:
+                    raise
+                log(f"  {WARNING} Drive rate limit hit. Retrying in {delay:.0f} seconds...")
                 time.sleep(delay)
 
         if last_exception:
             raise last_exception
         raise RuntimeError("Drive download retries exhausted")
     
-    def _sync_drive_folder_to_local(self, folder_id: str, dest_path: Path, recursive: bool = True, csv_only: bool = True) -> None:
-        """Recursively download CSV files from a Drive folder into a local directory."""
-        dest_path.mkdir(parents=True, exist_ok=True)
-        items = self._list_drive_children(folder_id)
-        
-        for item in items:
-            name = item["name"]
-            mime_type = item["mimeType"]
-            item_id = item["id"]
-            
-            if mime_type == "application/vnd.google-apps.folder":
-                if recursive:
-                    self._sync_drive_folder_to_local(item_id, dest_path / name, recursive=recursive, csv_only=csv_only)
-                continue
+    def _collect_drive_downloads(self, folder_id: str, dest_path: Path, recursive: bool, csv_only: bool,
+                                 log: Callable[[str], None] = print):
+        """Walk a Drive folder tree breadth-first, yielding (file metadata, local path) pairs.
+        Each local folder is created here, once, so downloads can skip mkdir. A lone
+        folder is streamed page by page; folders on the same level are listed concurrently."""
+        level = [(folder_id, dest_path)]
+        max_workers = max(1, int(self.config.get('drive_download_workers', 8)))
+        
+        while level:
+            for _, local_path in level:
+                local_path.mkdir(parents=True, exist_ok=True)
+            if len(level) == 1 or max_workers == 1:
+                listings = [self._iter_drive_children(level_id, log) for level_id, _ in level]
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(level))) as executor:
+                    listings = list(executor.map(
+                        functools.partial(self._list_drive_children, log=log), [level_id for level_id, _ in level]
+                    ))
+            
+            next_level = []
+            for (_, local_path), items in zip(level, listings):
+                for item in items:
+                    name = item["name"]
+                    
+                    if item["mimeType"] == "application/vnd.google-apps.folder":
+                        if recursive:
+                            next_level.append((item["id"], local_path / name))
+                        continue
+                    
+                    if csv_only and not name.lower().endswith(".csv"):
+                        continue
+                    
+                    yield item, local_path / name
+            level = next_level
+    
+    def _sync_drive_folder_to_local(self, folder_id: str, dest_path: Path, recursive: bool = True, csv_only: bool = True,
+                                    log: Callable[[str], None] = print) -> None:
+        """Download CSV files from a Drive folder into a local directory.
+        A per-folder manifest of (md5Checksum, modifiedTime) lets repeat syncs skip
+        unchanged files and remove local copies of files deleted from Drive.
+        Progress and retry messages, including those from worker threads, go to log."""
+        manifest_path = self._prepare_drive_cache_dir() / f"{folder_id}.manifest.json"
+        manifest = {}
+        if manifest_path.exists():
+            try:
+                with open(manifest_path, "rb") as f:
+                    manifest = _json_loads(f.read())
+            except (OSError, ValueError):
+                manifest = {}
+        if not manifest and dest_path.exists():
+            # No usable manifest: the local copy can't be trusted, start clean
+            shutil.rmtree(dest_path)
+        
+        new_manifest = {}
+        downloaded = 0
+        # Downloads start while the listing is still paging in. They are I/O bound;
+        # each worker thread gets its own Drive service (see _get_drive_service)
+        # because httplib2 is not thread-safe.
+        max_workers = max(1, int(self.config.get('drive_download_workers', 8)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for item, file_path in self._collect_drive_downloads(folder_id, dest_path, recursive, csv_only, log):
+                entry = {
+                    "path": str(file_path.relative_to(dest_path)),
+                    "md5Checksum": item.get("md5Checksum"),
+                    "modifiedTime": item.get("modifiedTime"),
+                }
+                new_manifest[item["id"]] = entry
+                previous = manifest.get(item["id"])
+                if previous == entry and file_path.exists() and (
+                    item.get("size") is None or file_path.stat().st_size == int(item["size"])
+                ):
+                    continue
+                downloaded += 1
+                futures.append(executor.submit(self._download_drive_file, item["id"], file_path, True, log))
             
-            if csv_only and not name.lower().endswith(".csv"):
-                continue
+            # Remove files deleted from Drive (unless a new file now has the same path)
+            current_paths = {entry["path"] for entry in new_manifest.values()}
+            for file_id, entry in manifest.items():
+                if file_id not in new_manifest and entry.get("path") not in current_paths:
+                    stale_path = dest_path / entry.get("path", "")
+                    if stale_path != dest_path and stale_path.is_file():
+                        stale_path.unlink()
             
-            self._download_drive_file(item_id, dest_path / name)
+            for future in futures:
+                future.result()
+        
+        skipped = len(new_manifest) - downloaded
+        if skipped:
+            log(f"  {CHECKMARK} {skipped} file(s) unchanged in Drive, using local copy")
+        
+        with open(manifest_path, "wb") as f:
+            f.write(_json_dumps(new_manifest))
     
     def _prepare_drive_cache_dir(self) -> Path:
         """Get local cache directory for Drive downloads."""
@@ -533,44 +917,40 @@ class CSVToSheetsAutomation:
 
         if folder_id and folder_name:
             target_path = sales_cache / folder_name
-            if target_path.exists():
-                shutil.rmtree(target_path)
             print(f"  Downloading {folder_name} from Google Drive...")
             self._sync_drive_folder_to_local(folder_id, target_path, recursive=True, csv_only=True)
             self._drive_sales_cache_path = sales_cache
             return target_path
 
-        if sales_cache.exists():
-            shutil.rmtree(sales_cache)
-        sales_cache.mkdir(parents=True, exist_ok=True)
-        
         print("  Downloading Sales_Input from Google Drive...")
         self._sync_drive_folder_to_local(self.drive_sales_input_id, sales_cache, recursive=True, csv_only=True)
         
         self._drive_sales_cache_path = sales_cache
         return sales_cache
     
-    def _prepare_labor_input_folder_from_drive(self) -> Path:
-        """Download Labor_Input folder from Google Drive into local cache."""
+    def _prepare_labor_input_folder_from_drive(self, log: Callable[[str], None] = print) -> Path:
+        """Download Labor_Input folder from Google Drive into local cache.
+        Messages go to log, so a background download can hold them back."""
         if self._drive_labor_cache_path and self._drive_labor_cache_path.exists():
             return self._drive_labor_cache_path
         
         cache_root = self._prepare_drive_cache_dir()
         labor_cache = cache_root / "Labor_Input"
-        if labor_cache.exists():
-            shutil.rmtree(labor_cache)
         labor_cache.mkdir(parents=True, exist_ok=True)
         
-        print("  Downloading Labor_Input from Google Drive...")
-        self._sync_drive_folder_to_local(self.drive_labor_input_id, labor_cache, recursive=False, csv_only=True)
+        log("  Downloading Labor_Input from Google Drive...")
+        self._sync_drive_folder_to_local(self.drive_labor_input_id, labor_cache, recursive=False, csv_only=True, log=log)
         
         self._drive_labor_cache_path = labor_cache
         return labor_cache
 
     def _retry_gspread(self, func, *args, **kwargs):
-        """Retry Google Sheets calls when rate-limited (HTTP 429)."""
+        """Retry Google Sheets calls when rate-limited (HTTP 429) or briefly unavailable (502/503).
+        500 is not retried: the request may already have been applied (e.g. an append)."""
         max_retries = self.config.get('gspread_max_retries', 5)
         base_delay = self.config.get('gspread_retry_base_seconds', 5)
+        max_delay = self.config.get('gspread_retry_max_seconds', 64)
+        started = time.monotonic()
 
         last_exception = None
         for attempt in range(max_retries):
@@ -581,25 +961,52 @@ class CSVToSheetsAutomation:
                 response = getattr(e, "response", None)
                 status_code = getattr(response, "status_code", None) or getattr(response, "status", None)
                 is_rate_limit = status_code == 429 or "429" in str(e)
-                if not is_rate_limit:
+                if not is_rate_limit and status_code not in (502, 503):
                     raise
-                delay = base_delay * (2 ** attempt)
-                print(f"  {WARNING} Rate limit hit. Retrying in {delay} seconds...")
+                delay = self._compute_backoff(attempt, max_retries, base_delay, max_delay,
+                                              getattr(response, "headers", None), started)
+                if delay is None:
+                    raise
+                reason = "Rate limit hit" if is_rate_limit else f"Sheets unavailable ({status_code})"
+                print(f"  {WARNING} {reason}. Retrying in {delay:.0f} seconds...")
                 time.sleep(delay)
 
         if last_exception:
             raise last_exception
         raise RuntimeError("Rate limit retries exhausted")
 
+    def _append_rows_batched(self, worksheet, rows: List[List]) -> None:
+        """Append rows in as few requests as possible, splitting before the 10 MB request limit."""
+        max_bytes = self.config.get('sheets_max_request_bytes', 8_000_000)
+        batch, batch_bytes = [], 0
+        for row in rows:
+            row_bytes = len(_json_dumps(row))
+            if batch and batch_bytes + row_bytes > max_bytes:
+                self._retry_gspread(worksheet.append_rows, batch, value_input_option='USER_ENTERED')
+                batch, batch_bytes = [], 0
+            batch.append(row)
+            batch_bytes += row_bytes
+        if batch:
+            self._retry_gspread(worksheet.append_rows, batch, value_input_option='USER_ENTERED')
+
+    def _load_worksheet_index(self) -> List[str]:
+        """Fetch every worksheet handle with one metadata call and return the tab titles.
+        sheet.worksheet(name) costs the same call, so this is done at most once per run."""
+        if not self._worksheet_index_loaded:
+            if not self.sheet:
+                raise RuntimeError("Google Sheet not loaded")
+            for ws in self._retry_gspread(self.sheet.worksheets):
+                self.worksheet_cache.setdefault(ws.title, ws)
+            self._worksheet_index_loaded = True
+        return list(self.worksheet_cache)
+
     def _get_worksheet(self, tab_name: str):
         """Get worksheet by name with caching and retry."""
-        if tab_name in self.worksheet_cache:
-            return self.worksheet_cache[tab_name]
-        if not self.sheet:
-            raise RuntimeError("Google Sheet not loaded")
-        worksheet = self._retry_gspread(self.sheet.worksheet, tab_name)
-        self.worksheet_cache[tab_name] = worksheet
-        return worksheet
+        if tab_name not in self.worksheet_cache:
+            self._load_worksheet_index()
+        if tab_name not in self.worksheet_cache:
+            raise gspread.exceptions.WorksheetNotFound(tab_name)
+        return self.worksheet_cache[tab_name]
 
     def _get_sheet_headers(self, tab_name: str, worksheet=None, force_refresh: bool = False) -> List[str]:
         """Get cached header row values for a worksheet."""
@@ -611,6 +1018,75 @@ class CSVToSheetsAutomation:
         headers = self._retry_gspread(ws.row_values, 1)
         self.sheet_headers_cache[tab_name] = headers
         return headers
+
+    def _get_date_column_values(self, tab_name: str, worksheet, date_col_index: int) -> List[str]:
+        """Get cached values (header included) of a worksheet's date column.
+        Cached per (tab, column), so callers that resolve the date column
+        differently never get each other's values."""
+        key = (tab_name, date_col_index)
+        if key in self.date_values_cache:
+            return self.date_values_cache[key]
+        values = self._retry_gspread(worksheet.col_values, date_col_index)
+        self.date_values_cache[key] = values
+        return values
+
+    def invalidate_existing_dates_cache(self, tab_name: Optional[str] = None) -> None:
+        """Drop cached Date column data for a tab (or all tabs) after a write."""
+        if tab_name is None:
+            self.existing_dates_cache.clear()
+            self.date_values_cache.clear()
+        else:
+            self.existing_dates_cache.pop(tab_name, None)
+            for key in [k for k in self.date_values_cache if k[0] == tab_name]:
+                del self.date_values_cache[key]
+
+    def _preload_sheet_state(self, tab_names: List[str]) -> None:
+        """Read the header row and Date column of several tabs with batchGet.
+        Two requests in total instead of two per tab (per date checked)."""
+        if self.test_mode or not self.sheet:
+            return
+        cached_tabs = {tab for tab, _ in self.date_values_cache}
+        tab_names = [t for t in dict.fromkeys(tab_names) if t not in cached_tabs]
+        if not tab_names:
+            return
+        expected_headers = {'date', 'week_ending_date', 'week ending date'}
+        
+        def quote(tab_name: str) -> str:
+            return "'" + tab_name.replace("'", "''") + "'"
+        
+        try:
+            # One metadata fetch for every worksheet instead of one per tab
+            if any(t not in self.worksheet_cache for t in tab_names):
+                self._load_worksheet_index()
+            tab_names = [t for t in tab_names if t in self.worksheet_cache]
+            if not tab_names:
+                return
+            
+            header_tabs = [t for t in tab_names if t not in self.sheet_headers_cache]
+            if header_tabs:
+                response = self._retry_gspread(self.sheet.values_batch_get, [f"{quote(t)}!1:1" for t in header_tabs])
+                for tab_name, value_range in zip(header_tabs, response.get('valueRanges', [])):
+                    values = value_range.get('values', [])
+                    self.sheet_headers_cache[tab_name] = values[0] if values else []
+            
+            keys = []
+            ranges = []
+            for tab_name in tab_names:
+                date_col_index = 1
+                for idx, header in enumerate(self.sheet_headers_cache[tab_name], start=1):
+                    if header and str(header).strip().lower() in expected_headers:
+                        date_col_index = idx
+                        break
+                keys.append((tab_name, date_col_index))
+                col_letter = self._column_index_to_a1(date_col_index)
+                ranges.append(f"{quote(tab_name)}!{col_letter}:{col_letter}")
+            response = self._retry_gspread(self.sheet.values_batch_get, ranges, params={'majorDimension': 'COLUMNS'})
+            for key, value_range in zip(keys, response.get('valueRanges', [])):
+                values = value_range.get('values', [])
+                self.date_values_cache[key] = values[0] if values else []
+        except Exception as e:
+            # Per-tab reads below still work, just slower
+            print(f"  {WARNING} Could not preload sheet data: {e}")
     
     def get_csv_folder_path(self) -> Path:
         """Get the path to the CSV folder. Auto-detects dated folders (e.g., SalesSummary_2025-12-31_2025-12-31).
@@ -629,8 +1105,8 @@ class CSVToSheetsAutomation:
                 folder_path = base_path / csv_folder
         
         # If the exact folder exists and contains CSV files directly, use it
-        if folder_path.exists() and folder_path.is_dir():
-            csv_files = list(folder_path.glob("*.csv"))
+        if folder_path.is_dir():
+            csv_files = self._list_directory(folder_path, suffix=".csv")
             if csv_files:
                 return folder_path
         
@@ -645,27 +1121,21 @@ class CSVToSheetsAutomation:
         
         # Otherwise, look for folders matching the pattern (e.g., SalesSummary_2025-12-31_2025-12-31 or daily_data_01_07_2025)
         # Look inside the configured folder (not parent) for subfolders starting with "SalesSummary"
-        search_dir = folder_path if folder_path.exists() and folder_path.is_dir() else folder_path.parent
+        search_dir = folder_path if folder_path.is_dir() else folder_path.parent
         
         # Find folders that start with "SalesSummary" (for new pattern)
         matching_folders = []
-        if search_dir.exists() and search_dir.is_dir():
-            matching_folders = [d for d in search_dir.iterdir() 
-                               if d.is_dir() and d.name.startswith("SalesSummary")]
+        if search_dir.is_dir():
+            matching_folders = self._list_directory(search_dir, prefix="SalesSummary", dirs=True)
         
         if matching_folders:
-            # Extract dates from folder names and select the one with the latest date
-            folders_with_dates = []
-            for folder in matching_folders:
-                date = self._extract_date_from_string(folder.name)
-                if date:
-                    folders_with_dates.append((folder, date))
-            
-            if folders_with_dates:
-                # Sort by date (latest first)
-                folders_with_dates.sort(key=lambda x: x[1], reverse=True)
-                selected_folder = folders_with_dates[0][0]
-                return selected_folder
+            # Select the folder with the latest date in its name (single pass)
+            latest = max(
+                ((folder, _extract_date(folder.name)) for folder in matching_folders),
+                key=lambda x: x[1] or datetime.min,
+            )
+            if latest[1]:
+                return latest[0]
             else:
                 # No dates found in names, use most recently modified
                 matching_folders.sort(key=lambda x: x.stat().st_mtime, reverse=True)
@@ -676,43 +1146,27 @@ class CSVToSheetsAutomation:
         # Return the original path if no match found (will be created if needed)
         return folder_path
     
+    def _list_directory(self, folder: Path, prefix: str = "", suffix: str = "", dirs: bool = False) -> List[Path]:
+        """List entries named prefix*suffix like folder.glob(), or subfolders
+        whose name starts with prefix (dirs=True) like iterdir()."""
+        try:
+            mtime_ns = folder.stat().st_mtime_ns
+            if time.time_ns() - mtime_ns < _DIR_LISTING_SETTLE_NS:
+                names, subdirs = _read_dir(str(folder))
+            else:
+                names, subdirs = _scan_dir(str(folder), mtime_ns)
+        except OSError:
+            return []
+        if dirs:
+            return [folder / name for name in subdirs if name.startswith(prefix)]
+        prefix, suffix = os.path.normcase(prefix), os.path.normcase(suffix)
+        return [folder / name for name in names
+                if os.path.normcase(name).startswith(prefix)
+                and os.path.normcase(name).endswith(suffix)]
+    
     def _extract_date_from_string(self, text: str) -> Optional[datetime]:
         """Helper method to extract date from a string (used for folder names)."""
-        # Pattern: SalesSummary_YYYY-MM-DD_YYYY-MM-DD (e.g., SalesSummary_2025-12-31_2025-12-31)
-        date_patterns = [
-            r'SalesSummary_(\d{4})-(\d{2})-(\d{2})_\d{4}-\d{2}-\d{2}',  # SalesSummary_2025-12-31_2025-12-31
-            # Legacy patterns for backward compatibility
-            r'daily_data_(\d{2})_(\d{2})_(\d{4})',  # daily_data_01_07_2025
-            r'daily_data_(\d{2})-(\d{2})-(\d{4})',  # daily_data_01-07-2025
-            r'daily_data(\d{8})',  # daily_data01072025
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
-            if match:
-                if pattern.startswith(r'SalesSummary'):
-                    # SalesSummary_YYYY-MM-DD_YYYY-MM-DD format
-                    year, month, day = match.groups()
-                    try:
-                        return datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
-                    except ValueError:
-                        continue
-                elif len(match.groups()) == 3:
-                    # MM_DD_YYYY or MM-DD-YYYY format (legacy)
-                    month, day, year = match.groups()
-                    try:
-                        return datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
-                    except ValueError:
-                        continue
-                elif len(match.groups()) == 1:
-                    # YYYYMMDD format (legacy)
-                    date_str = match.group(1)
-                    try:
-                        return datetime.strptime(date_str, "%Y%m%d")
-                    except ValueError:
-                        continue
-        
-        return None
+        return _extract_date(text)
     
     def extract_date_from_folder_name(self) -> Optional[datetime]:
         """Extract date from folder name (e.g., SalesSummary_2025-12-31_2025-12-31 -> 2025-12-31 or daily_data_01_07_2025 -> 2025-01-07)."""
@@ -723,20 +1177,7 @@ class CSVToSheetsAutomation:
     def extract_week_ending_date(self) -> Optional[datetime]:
         """Extract input date (second date) from folder name (e.g., SalesSummary_2025-12-29_2026-01-04 -> 2026-01-04)."""
         csv_folder = self.get_csv_folder_path()
-        folder_name = csv_folder.name
-        
-        # Pattern: SalesSummary_YYYY-MM-DD_YYYY-MM-DD (extract second date - input date)
-        pattern = r'SalesSummary_\d{4}-\d{2}-\d{2}_(\d{4})-(\d{2})-(\d{2})'
-        match = re.search(pattern, folder_name)
-        
-        if match:
-            year, month, day = match.groups()
-            try:
-                return datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
-            except ValueError:
-                pass
-        
-        return None
+        return _parse_sales_summary_input_date(csv_folder.name)
     
     def extract_week_ending_date_from_payroll_export(self, csv_file: Path) -> Optional[datetime]:
         """Extract input date from PayrollExport CSV filename.
@@ -751,24 +1192,22 @@ class CSVToSheetsAutomation:
         filename = csv_file.name
         
         # First try: PayrollExport_YYYY_MM_DD-YYYY_MM_DD (extract second date - input date)
-        pattern_two_dates = r'PayrollExport_\d{4}_\d{2}_\d{2}-(\d{4})_(\d{2})_(\d{2})'
-        match = re.search(pattern_two_dates, filename)
+        match = _PAYROLL_TWO_DATES_RE.search(filename)
         
         if match:
             year, month, day = match.groups()
             try:
-                return datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
+                return datetime(int(year), int(month), int(day))
             except ValueError:
                 pass
         
         # Second try: PayrollExport_YYYY_MM_DD (single date format)
-        pattern_single_date = r'PayrollExport_(\d{4})_(\d{2})_(\d{2})\.csv'
-        match = re.search(pattern_single_date, filename)
+        match = _PAYROLL_SINGLE_DATE_RE.search(filename)
         
         if match:
             year, month, day = match.groups()
             try:
-                return datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
+                return datetime(int(year), int(month), int(day))
             except ValueError:
                 pass
         
@@ -788,44 +1227,42 @@ class CSVToSheetsAutomation:
             return None, None, []
         
         # Find all PayrollExport CSV files
-        csv_files = list(labor_input_folder.glob("PayrollExport_*.csv"))
+        csv_files = self._list_directory(labor_input_folder, prefix="PayrollExport_", suffix=".csv")
         
         if not csv_files:
             print(f"  {WARNING} No PayrollExport CSV files found in {labor_input_folder}")
             return None, None, []
         
-        # Sort by modification time (newest first)
-        csv_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        
-        # Extract input dates and group by date
-        file_date_map = {}
+        # One pass: modification time and input date per file, grouped by date
+        mtimes = {}
+        file_dates = {}
+        file_date_map = defaultdict(list)
         for csv_file in csv_files:
+            mtimes[csv_file] = csv_file.stat().st_mtime
             week_ending_date = self.extract_week_ending_date_from_payroll_export(csv_file)
             if week_ending_date:
-                week_ending_str = week_ending_date.strftime("%Y-%m-%d")
-                if week_ending_str not in file_date_map:
-                    file_date_map[week_ending_str] = []
-                file_date_map[week_ending_str].append(csv_file)
+                file_dates[csv_file] = week_ending_date
+                file_date_map[week_ending_date].append(csv_file)
         
         if not file_date_map:
             print(f"  {WARNING} Could not extract input dates from any CSV files")
             return None, None, []
         
-        # Get the latest file (first in sorted list)
-        latest_file = csv_files[0]
-        latest_week_ending = self.extract_week_ending_date_from_payroll_export(latest_file)
+        # Get the latest file (most recently modified; only the duplicates below need ordering)
+        latest_file = max(csv_files, key=mtimes.__getitem__)
+        latest_week_ending = file_dates.get(latest_file)
         
         if not latest_week_ending:
             print(f"  {WARNING} Could not extract input date from latest file: {latest_file.name}")
             return None, None, []
         
-        latest_week_ending_str = latest_week_ending.strftime("%Y-%m-%d")
-        
         # Check for duplicate files with same input date
-        duplicate_files = file_date_map[latest_week_ending_str]
+        duplicate_files = file_date_map[latest_week_ending]
         if len(duplicate_files) > 1:
-            # Exclude the latest file from duplicates list
-            duplicate_files = [f for f in duplicate_files if f != latest_file]
+            # Exclude the latest file from duplicates list (newest first)
+            duplicate_files = sorted(
+                (f for f in duplicate_files if f != latest_file), key=mtimes.__getitem__, reverse=True
+            )
             return latest_file, latest_week_ending, duplicate_files
         
         return latest_file, latest_week_ending, []
@@ -833,7 +1270,10 @@ class CSVToSheetsAutomation:
     def get_all_existing_week_ending_dates(self, tab_name: str) -> "Set[str]":
         """Get all existing dates from a tab.
         Returns a set of date strings in YYYY-MM-DD format.
-        Works with both Excel (test_mode) and Google Sheets (production)."""
+        Works with both Excel (test_mode) and Google Sheets (production).
+        Results are cached per tab until invalidate_existing_dates_cache() is called."""
+        if tab_name in self.existing_dates_cache:
+            return self.existing_dates_cache[tab_name]
         existing_dates = set()
         expected_headers = {'date', 'week_ending_date', 'week ending date'}
         
@@ -848,31 +1288,18 @@ class CSVToSheetsAutomation:
                 return existing_dates
 
             date_col_index = 1
-            for col_idx in range(1, worksheet.max_column + 1):
-                header_val = worksheet.cell(row=1, column=col_idx).value
+            header_row = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            for col_idx, header_val in enumerate(header_row, start=1):
                 if header_val and str(header_val).strip().lower() in expected_headers:
                     date_col_index = col_idx
                     break
 
             # Check all data rows (starting from row 2)
-            for row_idx in range(2, worksheet.max_row + 1):
-                cell_value = worksheet.cell(row=row_idx, column=date_col_index).value
-                if cell_value is not None:
-                    # Convert to string for comparison
-                    try:
-                        if isinstance(cell_value, datetime):
-                            date_str = cell_value.strftime("%Y-%m-%d")
-                        elif isinstance(cell_value, pd.Timestamp):
-                            date_str = cell_value.strftime("%Y-%m-%d")
-                        else:
-                            try:
-                                date_str = pd.to_datetime(str(cell_value)).strftime("%Y-%m-%d")
-                            except Exception:
-                                date_str = str(cell_value).strip()
-                        if date_str:
-                            existing_dates.add(date_str)
-                    except:
-                        pass
+            existing_dates = _normalize_date_cells(
+                cell_value
+                for (cell_value,) in worksheet.iter_rows(min_row=2, min_col=date_col_index, max_col=date_col_index, values_only=True)
+                if cell_value is not None
+            )
         else:
             # Google Sheets version
             if not self.sheet:
@@ -892,26 +1319,16 @@ class CSVToSheetsAutomation:
 
             # Get all values from the date column
             try:
-                all_values = self._retry_gspread(worksheet.col_values, date_col_index)
+                all_values = self._get_date_column_values(tab_name, worksheet, date_col_index)
                 if len(all_values) <= 1:  # Only header or empty
                     return existing_dates
                 
                 # Check all data rows (starting from row 2, index 1)
-                for cell_value in all_values[1:]:  # Skip header
-                    if cell_value:
-                        # Convert to string for comparison
-                        try:
-                            try:
-                                cell_str = pd.to_datetime(str(cell_value)).strftime("%Y-%m-%d")
-                            except Exception:
-                                cell_str = str(cell_value).strip()
-                            if cell_str:
-                                existing_dates.add(cell_str)
-                        except:
-                            pass
+                existing_dates = _normalize_date_cells(v for v in all_values[1:] if v)
             except Exception as e:
                 return existing_dates
         
+        self.existing_dates_cache[tab_name] = existing_dates
         return existing_dates
     
     def find_all_sales_folders_with_dates(self) -> List[Tuple[Path, datetime]]:
@@ -931,16 +1348,15 @@ class CSVToSheetsAutomation:
             folder_path = self.get_csv_folder_path()
         
         # Look for folders matching the pattern
-        search_dir = folder_path if folder_path.exists() and folder_path.is_dir() else folder_path.parent
+        search_dir = folder_path if folder_path.is_dir() else folder_path.parent
         
         matching_folders = []
-        if search_dir.exists() and search_dir.is_dir():
-            matching_folders = [d for d in search_dir.iterdir() 
-                               if d.is_dir() and d.name.startswith("SalesSummary")]
+        if search_dir.is_dir():
+            matching_folders = self._list_directory(search_dir, prefix="SalesSummary", dirs=True)
         
         folders_with_dates = []
         for folder in matching_folders:
-            week_ending_date = self.extract_week_ending_date_from_folder(folder)
+            week_ending_date = _parse_sales_summary_input_date(folder.name)
             if week_ending_date:
                 folders_with_dates.append((folder, week_ending_date))
         
@@ -950,15 +1366,7 @@ class CSVToSheetsAutomation:
 
     def _extract_input_date_from_sales_folder_name(self, folder_name: str) -> Optional[datetime]:
         """Extract input date (second date) from a SalesSummary folder name."""
-        pattern = r'SalesSummary_\d{4}-\d{2}-\d{2}_(\d{4})-(\d{2})-(\d{2})'
-        match = re.search(pattern, folder_name)
-        if not match:
-            return None
-        year, month, day = match.groups()
-        try:
-            return datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
-        except ValueError:
-            return None
+        return _parse_sales_summary_input_date(folder_name)
 
     def find_all_sales_drive_folders_with_dates(self) -> List[Tuple[str, str, datetime]]:
         """Find all SalesSummary folders in Drive with their input dates."""
@@ -970,28 +1378,33 @@ class CSVToSheetsAutomation:
             folder_name = item.get("name", "")
             if not folder_name.startswith("SalesSummary"):
                 continue
-            input_date = self._extract_input_date_from_sales_folder_name(folder_name)
+            input_date = _parse_sales_summary_input_date(folder_name)
             if input_date:
                 folders_with_dates.append((item["id"], folder_name, input_date))
         
         folders_with_dates.sort(key=lambda x: x[2])
         return folders_with_dates
 
+    def _get_existing_dates_by_tab(self, tab_names: List[str]) -> Dict[str, "Set[str]"]:
+        """Existing dates for several tabs; Google tabs are read with one batchGet."""
+        self._preload_sheet_state(tab_names)
+        return {tab_name: self.get_all_existing_week_ending_dates(tab_name) for tab_name in tab_names}
+
     def find_missing_sales_folders(self) -> List[Tuple[Path, datetime]]:
         """Find all SalesSummary folders whose input dates are missing in any sales tab."""
-        existing_by_tab = {}
-        for tab_name in self.csv_to_tab_mapping.values():
-            existing_by_tab[tab_name] = self.get_all_existing_week_ending_dates(tab_name)
+        existing_by_tab = self._get_existing_dates_by_tab(list(self.csv_to_tab_mapping.values()))
 
         folders_with_dates = self.find_all_sales_folders_with_dates()
         if not folders_with_dates:
             return []
 
+        # A date is missing from some tab exactly when it is not in every tab's set
+        present_everywhere = set.intersection(*existing_by_tab.values()) if existing_by_tab else None
         missing = []
         self._last_missing_sales_debug = {}
         for folder, input_date in folders_with_dates:
-            input_date_str = input_date.strftime("%Y-%m-%d")
-            if any(input_date_str not in existing for existing in existing_by_tab.values()):
+            input_date_str = input_date.date().isoformat()
+            if present_everywhere is not None and input_date_str not in present_everywhere:
                 # Double-check using the same logic as processing
                 missing_tabs = []
                 for tab_name in self.csv_to_tab_mapping.values():
@@ -1006,19 +1419,19 @@ class CSVToSheetsAutomation:
 
     def find_missing_sales_drive_folders(self) -> List[Tuple[str, str, datetime]]:
         """Find all SalesSummary Drive folders whose input dates are missing in any sales tab."""
-        existing_by_tab = {}
-        for tab_name in self.csv_to_tab_mapping.values():
-            existing_by_tab[tab_name] = self.get_all_existing_week_ending_dates(tab_name)
+        existing_by_tab = self._get_existing_dates_by_tab(list(self.csv_to_tab_mapping.values()))
 
         folders_with_dates = self.find_all_sales_drive_folders_with_dates()
         if not folders_with_dates:
             return []
 
+        # A date is missing from some tab exactly when it is not in every tab's set
+        present_everywhere = set.intersection(*existing_by_tab.values()) if existing_by_tab else None
         missing = []
         self._last_missing_sales_debug = {}
         for folder_id, folder_name, input_date in folders_with_dates:
-            input_date_str = input_date.strftime("%Y-%m-%d")
-            if any(input_date_str not in existing for existing in existing_by_tab.values()):
+            input_date_str = input_date.date().isoformat()
+            if present_everywhere is not None and input_date_str not in present_everywhere:
                 missing_tabs = []
                 for tab_name in self.csv_to_tab_mapping.values():
                     exists, _ = self.check_week_ending_exists(tab_name, input_date)
@@ -1032,19 +1445,7 @@ class CSVToSheetsAutomation:
     
     def extract_week_ending_date_from_folder(self, folder: Path) -> Optional[datetime]:
         """Extract input date (second date) from folder name."""
-        folder_name = folder.name
-        # Pattern: SalesSummary_YYYY-MM-DD_YYYY-MM-DD (extract second date - input date)
-        pattern = r'SalesSummary_\d{4}-\d{2}-\d{2}_(\d{4})-(\d{2})-(\d{2})'
-        match = re.search(pattern, folder_name)
-        
-        if match:
-            year, month, day = match.groups()
-            try:
-                return datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
-            except ValueError:
-                pass
-        
-        return None
+        return _parse_sales_summary_input_date(folder.name)
     
     def find_oldest_missing_sales_folder(self) -> Optional[Tuple[Path, datetime]]:
         """Find the oldest SalesSummary folder whose input date is missing in any sales tab.
@@ -1063,7 +1464,7 @@ class CSVToSheetsAutomation:
             return None
         
         # Find all PayrollExport CSV files
-        csv_files = list(labor_input_folder.glob("PayrollExport_*.csv"))
+        csv_files = self._list_directory(labor_input_folder, prefix="PayrollExport_", suffix=".csv")
         
         if not csv_files:
             return None
@@ -1095,29 +1496,28 @@ class CSVToSheetsAutomation:
         if not labor_input_folder.exists():
             return []
 
-        csv_files = list(labor_input_folder.glob("PayrollExport_*.csv"))
+        csv_files = self._list_directory(labor_input_folder, prefix="PayrollExport_", suffix=".csv")
         if not csv_files:
             return []
 
         # Group by input date, track duplicates
-        file_date_map = {}
+        file_date_map = defaultdict(list)
         for csv_file in csv_files:
             input_date = self.extract_week_ending_date_from_payroll_export(csv_file)
             if input_date:
-                input_date_str = input_date.strftime("%Y-%m-%d")
-                file_date_map.setdefault(input_date_str, []).append(csv_file)
+                file_date_map[input_date].append(csv_file)
 
         missing = []
         self._last_missing_labor_debug = set()
-        for input_date_str, files in file_date_map.items():
-            # Choose latest file by modification time for this date
-            files_sorted = sorted(files, key=lambda x: x.stat().st_mtime, reverse=True)
-            selected_file = files_sorted[0]
-            duplicate_files = files_sorted[1:]
-            input_date = datetime.strptime(input_date_str, "%Y-%m-%d")
+        for input_date, files in file_date_map.items():
+            # Choose latest file by modification time for this date (stat only when there is a choice)
+            if len(files) > 1:
+                files = sorted(files, key=lambda x: x.stat().st_mtime, reverse=True)
+            selected_file = files[0]
+            duplicate_files = files[1:]
             exists, _ = self.check_week_ending_exists("Labor_Input", input_date)
             if not exists:
-                self._last_missing_labor_debug.add(input_date_str)
+                self._last_missing_labor_debug.add(input_date.strftime("%Y-%m-%d"))
                 missing.append((selected_file, input_date, duplicate_files))
 
         # Sort by date (oldest first)
@@ -1135,7 +1535,7 @@ class CSVToSheetsAutomation:
             print(f"Please download your CSV files to: {csv_folder}")
             return []
         
-        csv_files = list(csv_folder.glob("*.csv"))
+        csv_files = self._list_directory(csv_folder, suffix=".csv")
         
         if not csv_files:
             print(f"No CSV files found in {csv_folder}")
@@ -1160,8 +1560,44 @@ class CSVToSheetsAutomation:
         
         return csv_files
     
-    def _read_csv_safe(self, csv_file: Path) -> Optional[pd.DataFrame]:
-        """Read a CSV file safely, returning None if empty or unreadable."""
+    def _parse_csv(self, csv_file: Path, nrows: Optional[int] = None) -> pd.DataFrame:
+        """Parse a CSV file (or its first nrows rows) with pandas, reading it through a memory map.
+        With fast_csv enabled and pyarrow installed, pandas' multi-threaded pyarrow
+        engine is tried first; anything it rejects falls back to the C parser, and so
+        does any file where pyarrow inferred dates or timestamps, which the C parser
+        keeps as the CSV's original text."""
+        if nrows is None and self.config.get('fast_csv', False) and _HAS_PYARROW:
+            try:
+                df = pd.read_csv(csv_file, engine="pyarrow")
+            except ValueError:
+                pass
+            else:
+                if not any(dtype == object or dtype.kind in "mM" for dtype in df.dtypes):
+                    return df
+        return pd.read_csv(csv_file, memory_map=True, nrows=nrows)
+    
+    def _prefetch_csv_files(self, csv_files: List[Path]) -> None:
+        """Start parsing CSV files on a thread pool without waiting for them.
+        The (sequential) append loop picks each result up via _read_csv_safe, so
+        later files parse while earlier ones upload. pandas' C tokenizer releases
+        the GIL, so threads overlap without process/pickling overhead."""
+        if len(csv_files) < 2 or self.dry_run:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=min(len(csv_files), os.cpu_count() or 1))
+        for csv_file in csv_files:
+            self._csv_prefetch[csv_file] = executor.submit(self._parse_csv, csv_file)
+        executor.shutdown(wait=False)
+    
+    def _discard_csv_prefetch(self) -> None:
+        """Drop parsed (or still queued) files the append loop never used."""
+        for future in self._csv_prefetch.values():
+            future.cancel()
+        self._csv_prefetch.clear()
+    
+    def _read_csv_safe(self, csv_file: Path, nrows: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """Read a CSV file (or only its first nrows rows) safely, returning None if empty or unreadable."""
+        prefetched = self._csv_prefetch.pop(csv_file, None) if nrows is None else None
         if not csv_file.exists():
             print(f"  {WARNING} CSV file not found: {csv_file}")
             return None
@@ -1174,7 +1610,9 @@ class CSVToSheetsAutomation:
             return None
 
         try:
-            return pd.read_csv(csv_file)
+            if prefetched:
+                return prefetched.result()
+            return self._parse_csv(csv_file, nrows=nrows)
         except pd.errors.EmptyDataError:
             print(f"  {WARNING} CSV file has no data: {csv_file.name}")
             return None
@@ -1183,25 +1621,28 @@ class CSVToSheetsAutomation:
             return None
 
     def extract_date_from_csv(self, csv_file: Path) -> Optional[datetime]:
-        """Extract date from CSV file content."""
+        """Extract date from CSV file content (only the first data row is read)."""
         try:
-            df = self._read_csv_safe(csv_file)
+            df = self._read_csv_safe(csv_file, nrows=1)
             if df is None or df.empty:
                 return None
             
-            # Check for date column in various formats
-            date_columns = [col for col in df.columns 
-                          if 'date' in col.lower() or 'yyyyMMdd' in col or 'day' in col.lower()]
+            # Check for date column in various formats (first match wins)
+            date_col = None
+            for col in df.columns:
+                col_lower = col.lower()
+                if 'date' in col_lower or 'day' in col_lower or 'yyyyMMdd' in col:
+                    date_col = col
+                    break
             
-            if date_columns:
-                date_col = date_columns[0]
+            if date_col is not None:
                 first_date = df[date_col].iloc[0]
                 
                 # Handle yyyyMMdd format (e.g., 20260106)
-                if isinstance(first_date, (int, float)) and len(str(int(first_date))) == 8:
+                if (pd.api.types.is_integer(first_date) or pd.api.types.is_float(first_date)) and len(str(int(first_date))) == 8:
                     date_str = str(int(first_date))
                     try:
-                        return datetime.strptime(date_str, "%Y%m%d")
+                        return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
                     except ValueError:
                         pass
                 
@@ -1216,30 +1657,9 @@ class CSVToSheetsAutomation:
                             continue
             
             # Check filename for date pattern
-            filename = csv_file.stem
-            date_patterns = [
-                r'(\d{4}-\d{2}-\d{2})',  # 2026-01-06
-                r'(\d{8})',  # 20260106
-                r'(\d{2}/\d{2}/\d{4})',  # 01/06/2026
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, filename)
-                if match:
-                    date_str = match.group(1)
-                    # Try parsing
-                    if len(date_str) == 8 and date_str.isdigit():
-                        try:
-                            return datetime.strptime(date_str, "%Y%m%d")
-                        except ValueError:
-                            pass
-                    else:
-                        date_formats = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"]
-                        for fmt in date_formats:
-                            try:
-                                return datetime.strptime(date_str, fmt)
-                            except ValueError:
-                                continue
+            file_date = _extract_date(csv_file.stem, _FILENAME_DATE_PATTERNS)
+            if file_date:
+                return file_date
             
             print(f"  Warning: Could not extract date from {csv_file.name}")
             return None
@@ -1248,264 +1668,6 @@ class CSVToSheetsAutomation:
             print(f"  Error reading {csv_file.name}: {e}")
             return None
     
-    def get_date_column_index(self) -> Optional[int]:
-        """Get the index of the date column in the Google Sheet."""
-        date_col_name = self.config['google_sheet'].get('date_column')
-        if not date_col_name:
-            return None
-        
-        # Get header row (assuming row 1)
-        headers = self._retry_gspread(self.worksheet.row_values, 1)
-        
-        try:
-            # Try exact match first
-            col_index = headers.index(date_col_name) + 1  # +1 for 1-based indexing
-            return col_index
-        except ValueError:
-            # Try case-insensitive match
-            try:
-                col_index = next(i for i, h in enumerate(headers, 1) if h.lower() == date_col_name.lower())
-                print(f"  Note: Found date column '{headers[col_index-1]}' (case-insensitive match)")
-                return col_index
-            except StopIteration:
-                print(f"Warning: Date column '{date_col_name}' not found in sheet headers")
-                print(f"  Available headers: {headers[:15]}...")  # Show first 15 headers
-                return None
-    
-    def find_row_for_date(self, target_date: datetime) -> Optional[int]:
-        """Find the row number for a given date in target (Google Sheets or Excel)."""
-        if self.test_mode:
-            # For Excel, find existing row
-            excel_path = Path(__file__).parent / self.excel_file
-            try:
-                df = pd.read_excel(excel_path, sheet_name=self.excel_sheet_name, header=0)
-                date_column = self.config['google_sheet'].get('date_column', 'Date')
-                
-                if date_column not in df.columns:
-                    return None
-                
-                target_date_str = target_date.strftime("%Y-%m-%d")
-                
-                for idx, row_date in enumerate(df[date_column], start=2):
-                    if pd.notna(row_date):
-                        if isinstance(row_date, pd.Timestamp):
-                            row_date_str = row_date.strftime("%Y-%m-%d")
-                        elif isinstance(row_date, datetime):
-                            row_date_str = row_date.strftime("%Y-%m-%d")
-                        elif isinstance(row_date, str):
-                            try:
-                                row_date_str = pd.to_datetime(row_date).strftime("%Y-%m-%d")
-                            except:
-                                row_date_str = str(row_date).strip()
-                        else:
-                            row_date_str = str(row_date).strip()
-                        
-                        if row_date_str == target_date_str:
-                            return idx
-                
-                return None  # Row doesn't exist yet, will be created by create_row_for_date
-            except Exception as e:
-                return None
-        
-        # Google Sheets implementation (existing code)
-        date_col_index = self.get_date_column_index()
-        if not date_col_index:
-            return None
-        
-        # Get all values in the date column
-        date_col = self._retry_gspread(self.worksheet.col_values, date_col_index)
-        
-        # Format target date for comparison
-        target_date_strs = [
-            target_date.strftime("%Y-%m-%d"),
-            target_date.strftime("%m/%d/%Y"),
-            target_date.strftime("%d/%m/%Y"),
-            str(int(target_date.strftime("%Y%m%d"))),
-            target_date.strftime("%Y/%m/%d")
-        ]
-        
-        # Check each row (skip header row 1)
-        for row_idx, cell_value in enumerate(date_col[1:], start=2):
-            if not cell_value:
-                continue
-            
-            # Normalize cell value
-            cell_str = str(cell_value).strip()
-            
-            # Try parsing and comparing
-            for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y%m%d", "%Y/%m/%d"]:
-                try:
-                    cell_date = datetime.strptime(cell_str, fmt)
-                    if cell_date.date() == target_date.date():
-                        return row_idx
-                except ValueError:
-                    continue
-            
-            # Direct string comparison
-            if cell_str in target_date_strs:
-                return row_idx
-        
-        return None
-    
-    def create_row_for_date(self, target_date: datetime) -> Optional[int]:
-        """Create a new row for the given date in the target (Google Sheets or Excel)."""
-        if self.test_mode:
-            return self.find_or_create_row_in_excel(target_date)
-        
-        # Google Sheets implementation (existing code)
-        try:
-            # Get the date column index
-            date_col_index = self.get_date_column_index()
-            if not date_col_index:
-                print(f"  Error: Could not find date column '{self.config['google_sheet'].get('date_column', 'Date')}'")
-                print(f"  Available headers: {self._retry_gspread(self.worksheet.row_values, 1)[:10]}...")  # Show first 10 headers
-                return None
-            
-            # Get all existing rows to find where to insert
-            all_values = self._retry_gspread(self.worksheet.get_all_values)
-            if not all_values:
-                # Empty sheet, add header and first row
-                headers = self._retry_gspread(self.worksheet.row_values, 1)
-                if not headers:
-                    return None
-                new_row_num = 2
-            else:
-                # Find the right position to insert (keep dates sorted)
-                date_col_values = self._retry_gspread(self.worksheet.col_values, date_col_index)
-                new_row_num = len(date_col_values) + 1
-                
-                # Try to insert in chronological order
-                for row_idx, cell_value in enumerate(date_col_values[1:], start=2):
-                    if not cell_value:
-                        new_row_num = row_idx
-                        break
-                    try:
-                        # Try to parse the date
-                        cell_str = str(cell_value).strip()
-                        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y%m%d", "%Y/%m/%d"]:
-                            try:
-                                cell_date = datetime.strptime(cell_str, fmt)
-                                if cell_date.date() > target_date.date():
-                                    new_row_num = row_idx
-                                    break
-                            except ValueError:
-                                continue
-                        if new_row_num < len(date_col_values) + 1:
-                            break
-                    except:
-                        continue
-            
-            # Determine template row (row 2 should always be the template with formulas)
-            template_row = 2
-            
-            # Insert a new row
-            self._retry_gspread(self.worksheet.insert_row, [], new_row_num)
-            
-            # After insertion, the template row might have moved
-            # If we inserted at row 2, template is now at row 3
-            # If we inserted after row 2, template is still at row 2
-            actual_template_row = template_row if new_row_num > template_row else template_row + 1
-            
-            # Copy formulas from template row to the new row
-            # This ensures all formulas are preserved, even for the first data row
-            headers = self._retry_gspread(self.worksheet.row_values, 1)
-            num_cols = len(headers)
-            
-            # Copy formulas from template row to new row using batch update
-            import string
-            formula_updates = []
-            
-            for col_idx in range(1, num_cols + 1):
-                # Skip the date column - we'll set that manually
-                if col_idx == date_col_index:
-                    continue
-                
-                # Convert to A1 notation
-                col_letter = ''
-                col_num = col_idx
-                while col_num > 0:
-                    col_num -= 1
-                    col_letter = string.ascii_uppercase[col_num % 26] + col_letter
-                    col_num //= 26
-                
-                source_cell = f"{col_letter}{actual_template_row}"
-                target_cell = f"{col_letter}{new_row_num}"
-                
-                # Get the cell value with formula
-                try:
-                    cell = self._retry_gspread(self.worksheet.acell, source_cell, value_render_option='FORMULA')
-                    if cell.value and str(cell.value).strip().startswith('='):
-                        # Adjust formula references to point to the new row
-                        formula = str(cell.value)
-                        # Replace the template row number with the new row number in the formula
-                        # This handles formulas like =IF(A2="","",TEXT(A2,"ddd")) -> =IF(A3="","",TEXT(A3,"ddd"))
-                        adjusted_formula = formula.replace(f"A{actual_template_row}", f"A{new_row_num}")
-                        adjusted_formula = adjusted_formula.replace(f"$A{actual_template_row}", f"$A{new_row_num}")
-                        # Also replace the row number in other column references
-                        import re
-                        # Replace row numbers in cell references (e.g., B2, C2, etc.)
-                        pattern = r'([A-Z]+\$?)(\d+)'
-                        def replace_row(match):
-                            col_ref = match.group(1)
-                            row_num = int(match.group(2))
-                            if row_num == actual_template_row:
-                                return f"{col_ref}{new_row_num}"
-                            return match.group(0)
-                        adjusted_formula = re.sub(pattern, replace_row, adjusted_formula)
-                        
-                        formula_updates.append({
-                            'range': target_cell,
-                            'values': [[adjusted_formula]]
-                        })
-                except Exception as e:
-                    # If we can't get the formula, skip this column
-                    pass
-            
-            # Batch update all formulas at once
-            # Use value_input_option='USER_ENTERED' to ensure formulas are interpreted as formulas, not text
-            if formula_updates:
-                for update in formula_updates:
-                    try:
-                        self._retry_gspread(
-                            self.worksheet.update,
-                            range_name=update['range'],
-                            values=update['values'],
-                            value_input_option='USER_ENTERED'  # This ensures formulas are treated as formulas, not text
-                        )
-                    except Exception as e:
-                        print(f"    Warning: Could not copy formula to {update['range']}: {e}")
-                print(f"  {CHECKMARK} Copied {len(formula_updates)} formulas from template row {actual_template_row} to row {new_row_num}")
-            
-            # Set the date in the date column using direct range update (more reliable)
-            date_formatted = self.format_date_for_sheet(target_date)
-            # Convert column index to A1 notation (e.g., 1 -> A, 2 -> B, 27 -> AA)
-            import string
-            col_letter = ''
-            col_num = date_col_index
-            while col_num > 0:
-                col_num -= 1
-                col_letter = string.ascii_uppercase[col_num % 26] + col_letter
-                col_num //= 26
-            date_range = f"{col_letter}{new_row_num}"
-            
-            # Always update the date column (even if it has a formula, we want to set the actual date)
-            self._retry_gspread(
-                self.worksheet.update,
-                range_name=date_range,
-                values=[[date_formatted]],
-                value_input_option='USER_ENTERED'
-            )
-            
-            print(f"  {CHECKMARK} Set date '{date_formatted}' in column {date_col_index} (row {new_row_num})")
-            
-            return new_row_num
-            
-        except Exception as e:
-            print(f"  Error creating row: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
-    
     def map_csv_to_sheet_columns(self, csv_file: Path, target_date: datetime) -> Dict[str, any]:
         """Map CSV data to Google Sheet columns based on csv_structure.json."""
         csv_filename = csv_file.name
@@ -1573,7 +1735,8 @@ class CSVToSheetsAutomation:
             return df[column].iloc[0]
         elif rule_type == 'total':
             # Find row with 'Total' in any column
-            total_row = df[df.apply(lambda row: any('Total' in str(val) for val in row), axis=1)]
+            has_total = df.astype(str).apply(lambda col: col.str.contains('Total', regex=False)).any(axis=1)
+            total_row = df[has_total]
             if not total_row.empty:
                 return total_row[column].iloc[0]
         elif rule_type == 'filter':
@@ -1624,48 +1787,23 @@ class CSVToSheetsAutomation:
             if category_col not in df.columns:
                 return results
             
+            # Row for each category: exact, then case-insensitive, then partial match
+            # (e.g., "Non-Grat Svc Ch" might match "Non-Gratuity Service Charges")
+            positions = _first_category_positions(df[category_col], categories, "-,")
+            
             # For each category and metric combination, create a column
             for category in categories:
-                # Find the row for this category (case-insensitive and strip whitespace)
-                category_clean = str(category).strip()
-                # Try exact match first
-                category_row = df[df[category_col].astype(str).str.strip() == category_clean]
-                
-                # If no exact match, try case-insensitive
-                if category_row.empty:
-                    category_row = df[df[category_col].astype(str).str.strip().str.lower() == category_clean.lower()]
-                
-                # If still no match, try partial match (e.g., "Non-Grat Svc Ch" might match "Non-Gratuity Service Charges")
-                if category_row.empty:
-                    # Extract key words from category (remove punctuation, split on spaces/hyphens)
-                    category_words = category_clean.lower().replace('-', ' ').replace(',', ' ').split()
-                    if len(category_words) > 0:
-                        # Try to find rows where the category contains any of the key words
-                        mask = df[category_col].astype(str).str.lower()
-                        for word in category_words:
-                            if len(word) > 2:  # Only use words longer than 2 characters
-                                matches = mask.str.contains(word, na=False, regex=False)
-                                if matches.any():
-                                    category_row = df[matches]
-                                    break
-                
-                if not category_row.empty:
+                row_pos = positions[category]
+                if row_pos is not None:
                     for metric in metrics:
                         if metric in df.columns:
                             # Format column name (e.g., "Food Items", "Food Net sales")
                             column_name = column_format.format(category=category, metric=metric)
-                            value = category_row[metric].iloc[0]
+                            value = df[metric].iloc[row_pos]
                             
-                            # Handle NaN values and convert to appropriate type
+                            # Skip NaN values
                             if pd.notna(value):
-                                # Convert numeric values appropriately
-                                try:
-                                    if isinstance(value, (int, float)):
-                                        results[column_name] = value
-                                    else:
-                                        results[column_name] = value
-                                except (ValueError, TypeError):
-                                    results[column_name] = value
+                                results[column_name] = value
                 else:
                     # Warn if category not found (for debugging)
                     print(f"    Warning: Category '{category}' not found in CSV for category pivot")
@@ -1683,108 +1821,44 @@ class CSVToSheetsAutomation:
             if not primary_col or primary_col not in df.columns:
                 return results
             
-            # Create combined category column for matching
-            def combine_categories(row):
-                primary_val = str(row[primary_col]).strip() if pd.notna(row[primary_col]) else ''
-                secondary_val = str(row[secondary_col]).strip() if secondary_col and secondary_col in df.columns and pd.notna(row[secondary_col]) else ''
-                
-                if secondary_val and secondary_val != '' and secondary_val.lower() != 'nan':
-                    return combine_format.format(primary=primary_val, secondary=secondary_val)
-                else:
-                    return primary_val
+            # Create combined category column for matching (column-wise, not a row-by-row apply)
+            primary = df[primary_col].astype(str).str.strip().where(df[primary_col].notna(), '')
+            combined = primary.copy()
+            if secondary_col and secondary_col in df.columns:
+                secondary = df[secondary_col].astype(str).str.strip().where(df[secondary_col].notna(), '')
+                has_secondary = (secondary != '') & (secondary.str.lower() != 'nan')
+                combined[has_secondary] = [
+                    combine_format.format(primary=primary_val, secondary=secondary_val)
+                    for primary_val, secondary_val in zip(primary[has_secondary], secondary[has_secondary])
+                ]
             
-            # Add combined category column to dataframe for matching
-            df['_combined_category'] = df.apply(combine_categories, axis=1)
+            # Row for each combined category: exact, then case-insensitive, then partial match
+            positions = _first_category_positions(combined, categories, "-/,")
             
             # For each category and metric combination, create a column
             for category in categories:
-                category_clean = str(category).strip()
-                
-                # Find the row for this combined category
-                category_row = df[df['_combined_category'].astype(str).str.strip() == category_clean]
-                
-                # If no exact match, try case-insensitive
-                if category_row.empty:
-                    category_row = df[df['_combined_category'].astype(str).str.strip().str.lower() == category_clean.lower()]
-                
-                # If still no match, try partial match
-                if category_row.empty:
-                    category_words = category_clean.lower().replace('-', ' ').replace('/', ' ').replace(',', ' ').split()
-                    if len(category_words) > 0:
-                        mask = df['_combined_category'].astype(str).str.lower()
-                        for word in category_words:
-                            if len(word) > 2:  # Only use words longer than 2 characters
-                                matches = mask.str.contains(word, na=False, regex=False)
-                                if matches.any():
-                                    category_row = df[matches]
-                                    break
-                
-                if not category_row.empty:
+                row_pos = positions[category]
+                if row_pos is not None:
                     for metric in metrics:
                         if metric in df.columns:
                             # Format column name (e.g., "Cash Count", "Credit/debit - MASTERCARD Amount")
                             column_name = column_format.format(category=category, metric=metric)
-                            value = category_row[metric].iloc[0]
+                            value = df[metric].iloc[row_pos]
                             
-                            # Handle NaN values and convert to appropriate type
+                            # Skip NaN values
                             if pd.notna(value):
-                                # Convert numeric values appropriately
-                                try:
-                                    if isinstance(value, (int, float)):
-                                        results[column_name] = value
-                                    else:
-                                        results[column_name] = value
-                                except (ValueError, TypeError):
-                                    results[column_name] = value
+                                results[column_name] = value
                 else:
                     # Warn if category not found (for debugging)
                     print(f"    Warning: Combined category '{category}' not found in CSV for category pivot")
         
         return results
     
-    def check_existing_data(self, row_num: int) -> bool:
-        """Check if row already has data (beyond just the date) in the current worksheet."""
-        if not row_num:
-            return False
-        
-        if self.test_mode:
-            # For Excel, check if row has data in the current worksheet
-            if not self.excel_worksheet:
-                return False
-            try:
-                # Check if row exists and has data beyond date column
-                if row_num > self.excel_worksheet.max_row:
-                    return False
-                
-                # Check if any cells beyond the first column (Date) have data
-                for col in range(2, self.excel_worksheet.max_column + 1):
-                    cell_value = self.excel_worksheet.cell(row=row_num, column=col).value
-                    if cell_value is not None and str(cell_value).strip():
-                        return True
-                return False
-            except Exception as e:
-                return False
-        
-        # Google Sheets implementation
-        if not self.worksheet:
-            return False
-        row_values = self._retry_gspread(self.worksheet.row_values, row_num)
-        # Check if any cells beyond the first few have data
-        return len([v for v in row_values[1:] if v]) > 0
-    
     def cell_has_formula(self, row_num: int, col_index: int) -> bool:
         """Check if a cell contains a formula."""
         try:
             # Convert column index to A1 notation
-            import string
-            col_letter = ''
-            col_num = col_index
-            while col_num > 0:
-                col_num -= 1
-                col_letter = string.ascii_uppercase[col_num % 26] + col_letter
-                col_num //= 26
-            
-            cell_range = f"{col_letter}{row_num}"
+            cell_range = f"{_column_letter(col_index)}{row_num}"
             
             # Try to get the cell with formula rendering
             try:
@@ -1808,121 +1882,6 @@ class CSVToSheetsAutomation:
             # If we can't check, assume no formula to be safe (we'll update it)
             return False
     
-    def update_google_sheet(self, row_num: int, data: Dict[str, any]) -> bool:
-        """Update Google Sheet row with mapped data. Preserves formulas in cells.
-        
-        IMPORTANT: Only updates columns that are in the 'data' dictionary, which only
-        contains columns specified in the config.json column_mappings. Other columns
-        are never touched by this function.
-        """
-        if not row_num:
-            print("  Error: Cannot update - row number not found")
-            return False
-        
-        try:
-            # Get column headers
-            headers = self._retry_gspread(self.worksheet.row_values, 1)
-            
-            # Sort data to put Date column first (same as test mode)
-            date_col_name = self.config['google_sheet'].get('date_column', 'Date')
-            sorted_data = {}
-            if date_col_name in data:
-                sorted_data[date_col_name] = data[date_col_name]
-            for key, value in data.items():
-                if key != date_col_name:
-                    sorted_data[key] = value
-            
-            # Prepare update batch
-            # NOTE: Only columns in 'data' (from column_mappings) will be updated
-            # All other columns in the sheet are left untouched
-            updates = []
-            skipped_formulas = []
-            for sheet_col, value in sorted_data.items():
-                # Try exact match first, then case-insensitive
-                try:
-                    col_index = headers.index(sheet_col) + 1
-                except ValueError:
-                    # Try case-insensitive match
-                    try:
-                        col_index = next(i for i, h in enumerate(headers, 1) if h.lower() == sheet_col.lower())
-                        print(f"  Note: Found column '{headers[col_index-1]}' for '{sheet_col}' (case-insensitive)")
-                    except StopIteration:
-                        print(f"  Warning: Column '{sheet_col}' not found in sheet headers")
-                        continue
-                
-                # Check if cell has a formula - if so, skip updating it
-                # Only check for formulas if the cell is not empty (to avoid false positives)
-                try:
-                    # Get current cell value to check if it exists
-                    import string
-                    check_col_letter = ''
-                    check_col_num = col_index
-                    while check_col_num > 0:
-                        check_col_num -= 1
-                        check_col_letter = string.ascii_uppercase[check_col_num % 26] + check_col_letter
-                        check_col_num //= 26
-                    check_range = f"{check_col_letter}{row_num}"
-                    current_cell = self._retry_gspread(self.worksheet.acell, check_range, value_render_option='FORMULA')
-                    
-                    # If cell has a formula (starts with '='), skip it
-                    if current_cell.value and str(current_cell.value).strip().startswith('='):
-                        skipped_formulas.append(sheet_col)
-                        continue
-                except:
-                    # If we can't check, proceed with update (safer to update than skip)
-                    pass
-                
-                # Convert value to appropriate format
-                if pd.isna(value):
-                    cell_value = ""
-                elif isinstance(value, (int, float)):
-                    cell_value = float(value)
-                else:
-                    cell_value = str(value)
-                
-                # Convert column index to A1 notation (e.g., 1 -> A, 2 -> B, 27 -> AA)
-                import string
-                col_letter = ''
-                col_num = col_index
-                while col_num > 0:
-                    col_num -= 1
-                    col_letter = string.ascii_uppercase[col_num % 26] + col_letter
-                    col_num //= 26
-                
-                updates.append({
-                    'range': f"{col_letter}{row_num}",
-                    'values': [[cell_value]]
-                })
-            
-            # Batch update
-            # Use value_input_option='USER_ENTERED' to ensure proper formatting
-            if updates:
-                for update in updates:
-                    self._retry_gspread(
-                        self.worksheet.update,
-                        range_name=update['range'],
-                        values=update['values'],
-                        value_input_option='USER_ENTERED'
-                    )
-                
-                print(f"  {CHECKMARK} Updated {len(updates)} columns in row {row_num}")
-                if skipped_formulas:
-                    print(f"  Note: Skipped {len(skipped_formulas)} columns with formulas: {', '.join(skipped_formulas[:3])}{'...' if len(skipped_formulas) > 3 else ''}")
-                date_col_name = self.config['google_sheet'].get('date_column', 'Date')
-                if date_col_name in data:
-                    print(f"  {CHECKMARK} Date '{data[date_col_name]}' should be in row {row_num}")
-                return True
-            else:
-                if skipped_formulas:
-                    print(f"  Note: All columns had formulas, no data updated (formulas preserved)")
-                else:
-                    print("  Warning: No valid updates to perform")
-                return False
-                
-        except Exception as e:
-            print(f"  Error updating Google Sheet: {e}")
-            return False
-    
     def create_excel_backup(self, excel_path: Path) -> Optional[Path]:
         """Create a backup of the Excel file before updating."""
         try:
@@ -1945,6 +1904,20 @@ class CSVToSheetsAutomation:
             print(f"  {WARNING} Could not create backup: {e}")
             return None
     
+    def flush_workbook(self) -> bool:
+        """Save the workbook once if it has unsaved changes (writes are batched per run)."""
+        if not self._workbook_dirty or self.workbook is None or self.dry_run:
+            return True
+        try:
+            self.workbook.save(self.excel_file_path)
+            self._workbook_dirty = False
+            print(f"\n  {CHECKMARK} Saved Excel file: {Path(self.excel_file_path).name}")
+            return True
+        except PermissionError:
+            print(f"  {WARNING} Could not save Excel file (file may be open in another program)")
+            print(f"  {WARNING} Please close the Excel file and run the script again to save changes")
+            return False
+    
     def load_excel_file(self) -> bool:
         """Load Excel file for test mode."""
         try:
@@ -1957,13 +1930,12 @@ class CSVToSheetsAutomation:
                 found_path = None
                 
                 # Search in subdirectories
-                for subdir in base_path.iterdir():
-                    if subdir.is_dir():
-                        potential_path = subdir / self.excel_file
-                        # Skip backup files
-                        if potential_path.exists() and "backup" not in potential_path.name.lower():
-                            found_path = potential_path
-                            break
+                for subdir in self._list_directory(base_path, dirs=True):
+                    potential_path = subdir / self.excel_file
+                    # Skip backup files
+                    if potential_path.exists() and "backup" not in potential_path.name.lower():
+                        found_path = potential_path
+                        break
                 
                 if found_path:
                     excel_path = found_path
@@ -1982,11 +1954,15 @@ class CSVToSheetsAutomation:
             # Store the actual path found
             self.excel_file_path = excel_path
             
-            # Create backup before loading
-            self.create_excel_backup(excel_path)
+            # Create backup before loading (dry runs never write the file)
+            if not self.dry_run:
+                self.create_excel_backup(excel_path)
             
             # Load workbook with openpyxl to preserve formatting
+            from openpyxl import load_workbook
             self.workbook = load_workbook(excel_path)
+            self._workbook_dirty = False
+            self.existing_dates_cache.clear()
             
             # Check if we should use test sheet for column creation
             if self.test_mode and self.auto_create_columns and self.test_sheet_name:
@@ -1994,11 +1970,8 @@ class CSVToSheetsAutomation:
                 self.using_test_sheet = True
                 if not self.create_or_get_test_sheet():
                     return False
-                # Save workbook after creating test sheet so it's available for reading
-                try:
-                    self.workbook.save(excel_path)
-                except PermissionError:
-                    print(f"  {WARNING} Could not save Excel file (file may be open). Will try again when updating data.")
+                # The test sheet is written with the rest of the run's changes
+                self._workbook_dirty = True
                 print(f"  {CHECKMARK} Loaded Excel file: {excel_path.name}")
             else:
                 # Use regular sheet
@@ -2020,10 +1993,8 @@ class CSVToSheetsAutomation:
             return False
     
     def create_or_get_sheet(self, sheet_name: str) -> bool:
-        """Create or get a sheet by name for dynamic column creation. Uses same header styles as Daily Ops."""
+        """Create or get a sheet by name for dynamic column creation."""
         try:
-            from copy import copy
-            
             if not self.workbook:
                 print(f"  {CROSS} Workbook not loaded")
                 return False
@@ -2036,35 +2007,6 @@ class CSVToSheetsAutomation:
                 self.excel_worksheet = self.workbook.create_sheet(sheet_name)
                 print(f"  {CHECKMARK} Created new empty sheet: {sheet_name}")
             
-            # Get header style from original "Daily Ops" sheet to match formatting
-            if self.excel_sheet_name in self.workbook.sheetnames:
-                source_sheet = self.workbook[self.excel_sheet_name]
-                if source_sheet.max_row > 0 and source_sheet.max_column > 0:
-                    # Get style from first row, first column as template
-                    template_cell = source_sheet.cell(row=1, column=1)
-                    self.header_style = {
-                        'font': copy(template_cell.font) if template_cell.font else Font(bold=True, size=11),
-                        'fill': copy(template_cell.fill) if template_cell.fill else None,
-                        'alignment': copy(template_cell.alignment) if template_cell.alignment else Alignment(horizontal='center', vertical='center'),
-                        'border': copy(template_cell.border) if template_cell.border else None
-                    }
-                else:
-                    # Default header style
-                    self.header_style = {
-                        'font': Font(bold=True, size=11),
-                        'fill': None,
-                        'alignment': Alignment(horizontal='center', vertical='center'),
-                        'border': None
-                    }
-            else:
-                # Default header style if source sheet not found
-                self.header_style = {
-                    'font': Font(bold=True, size=11),
-                    'fill': None,
-                    'alignment': Alignment(horizontal='center', vertical='center'),
-                    'border': None
-                }
-            
             return True
         except Exception as e:
             print(f"  {CROSS} Error creating/getting sheet '{sheet_name}': {e}")
@@ -2076,480 +2018,6 @@ class CSVToSheetsAutomation:
         """Create or get the test sheet for dynamic column creation."""
         return self.create_or_get_sheet(self.test_sheet_name)
     
-    def ensure_column_exists(self, column_name: str, existing_headers: list = None) -> int:
-        """Ensure a column exists in the current worksheet. Returns column index (1-based).
-        
-        Args:
-            column_name: Name of the column to ensure exists
-            existing_headers: Optional list of existing headers to avoid re-reading
-        """
-        if not self.excel_worksheet:
-            return None
-        
-        try:
-            from copy import copy
-            
-            # Get existing headers from first row if not provided
-            if existing_headers is None:
-                headers = []
-                for col in range(1, self.excel_worksheet.max_column + 1):
-                    cell_value = self.excel_worksheet.cell(row=1, column=col).value
-                    if cell_value:
-                        headers.append(str(cell_value).strip())
-                    else:
-                        break
-            else:
-                headers = existing_headers[:]  # Copy to avoid modifying original
-            
-            # Check if column already exists (case-insensitive)
-            for idx, header in enumerate(headers, start=1):
-                if header.lower() == column_name.lower():
-                    return idx
-            
-            # Column doesn't exist, add it
-            date_col_name = self.config['google_sheet'].get('date_column', 'Date')
-            
-            # If this is the Date column, ensure it's first
-            if column_name == date_col_name:
-                # If headers exist but Date is not first, we need to insert it
-                if headers and headers[0].lower() != date_col_name.lower():
-                    # Date column should be first - this case is handled in update_excel_file
-                    # by ensuring Date is created first before other columns
-                    pass
-                
-                # Add Date column at position 1
-                # If there are existing columns, we need to shift them right
-                if self.excel_worksheet.max_column > 0:
-                    # Shift all existing columns one position to the right
-                    max_col = self.excel_worksheet.max_column
-                    for row in range(1, self.excel_worksheet.max_row + 1):
-                        # Start from the rightmost column and move left
-                        for col in range(max_col, 0, -1):
-                            source_cell = self.excel_worksheet.cell(row=row, column=col)
-                            target_cell = self.excel_worksheet.cell(row=row, column=col + 1)
-                            target_cell.value = source_cell.value
-                            if source_cell.font:
-                                target_cell.font = copy(source_cell.font)
-                            if source_cell.fill:
-                                target_cell.fill = copy(source_cell.fill)
-                            if source_cell.alignment:
-                                target_cell.alignment = copy(source_cell.alignment)
-                            if source_cell.border:
-                                target_cell.border = copy(source_cell.border)
-                            target_cell.number_format = source_cell.number_format
-                
-                # Now add Date header at column 1
-                date_cell = self.excel_worksheet.cell(row=1, column=1)
-                date_cell.value = date_col_name
-                
-                # Apply header style
-                if hasattr(self, 'header_style'):
-                    if self.header_style.get('font'):
-                        date_cell.font = self.header_style['font']
-                    if self.header_style.get('fill'):
-                        date_cell.fill = self.header_style['fill']
-                    if self.header_style.get('alignment'):
-                        date_cell.alignment = self.header_style['alignment']
-                    if self.header_style.get('border'):
-                        date_cell.border = self.header_style['border']
-                
-                print(f"  {CHECKMARK} Added Date column as first column")
-                return 1
-            else:
-                # Regular column - add at the end
-                # But first check if Date column exists, if not add it first
-                date_exists = False
-                for header in headers:
-                    if header.lower() == date_col_name.lower():
-                        date_exists = True
-                        break
-                
-                if not date_exists:
-                    # Date doesn't exist, add it first (recursively, but Date won't recurse)
-                    self.ensure_column_exists(date_col_name, headers)
-                    # Refresh headers count
-                    new_col_index = self.excel_worksheet.max_column + 1
-                else:
-                    # Date exists, add new column after existing columns
-                    new_col_index = self.excel_worksheet.max_column + 1
-                    if new_col_index == 1:
-                        # Only Date column exists, so new column goes to position 2
-                        new_col_index = 2
-                
-                # Add new column header
-                new_cell = self.excel_worksheet.cell(row=1, column=new_col_index)
-                new_cell.value = column_name
-                
-                # Apply header style matching original sheet
-                if hasattr(self, 'header_style'):
-                    if self.header_style.get('font'):
-                        new_cell.font = self.header_style['font']
-                    if self.header_style.get('fill'):
-                        new_cell.fill = self.header_style['fill']
-                    if self.header_style.get('alignment'):
-                        new_cell.alignment = self.header_style['alignment']
-                    if self.header_style.get('border'):
-                        new_cell.border = self.header_style['border']
-                
-                print(f"  {CHECKMARK} Created new column: {column_name}")
-                return new_col_index
-            
-        except Exception as e:
-            print(f"  {WARNING} Error ensuring column exists for '{column_name}': {e}")
-            import traceback
-            traceback.print_exc()
-            return None
-    
-    def find_or_create_row_in_excel(self, target_date: datetime) -> Optional[int]:
-        """Find or create a row for the target date in Excel file."""
-        if not self.excel_worksheet:
-            return None
-        
-        try:
-            date_column = self.config['google_sheet'].get('date_column', 'Date')
-            target_date_str = target_date.strftime("%Y-%m-%d")
-            
-            # For sheets with auto-create enabled, handle empty sheet case
-            if self.auto_create_columns:
-                # Check if sheet is empty (no headers or no data rows)
-                if self.excel_worksheet.max_row == 0 or (self.excel_worksheet.max_row == 1 and not self.excel_worksheet.cell(row=1, column=1).value):
-                    # Empty sheet, create first row with Date column
-                    date_col_index = 1
-                    date_cell = self.excel_worksheet.cell(row=1, column=date_col_index)
-                    date_cell.value = date_column
-                    # Apply header style
-                    if hasattr(self, 'header_style'):
-                        if self.header_style.get('font'):
-                            date_cell.font = self.header_style['font']
-                        if self.header_style.get('fill'):
-                            date_cell.fill = self.header_style['fill']
-                        if self.header_style.get('alignment'):
-                            date_cell.alignment = self.header_style['alignment']
-                        if self.header_style.get('border'):
-                            date_cell.border = self.header_style['border']
-                
-                # Now read the sheet to find existing rows
-                if not self.excel_file_path:
-                    print(f"  {CROSS} Excel file path not set")
-                    return None
-                
-                # For sheets with auto-create, we can work directly with the worksheet object
-                # Check if sheet is empty by checking if there are any headers
-                has_headers = False
-                if self.excel_worksheet.max_row >= 1:
-                    for col in range(1, self.excel_worksheet.max_column + 1):
-                        if self.excel_worksheet.cell(row=1, column=col).value:
-                            has_headers = True
-                            break
-                
-                if self.excel_worksheet.max_row == 0 or not has_headers:
-                    # Empty sheet - treat as empty DataFrame
-                    df = pd.DataFrame()
-                else:
-                    # Try to read from file, but if it fails (file open or sheet not saved), work with worksheet directly
-                    try:
-                        excel_path = self.excel_file_path
-                        active_sheet_name = self.test_sheet_name
-                        # Try to save first
-                        try:
-                            self.workbook.save(excel_path)
-                        except PermissionError:
-                            pass  # File might be open, continue anyway
-                        
-                        df = pd.read_excel(excel_path, sheet_name=active_sheet_name, header=0)
-                    except (ValueError, PermissionError, FileNotFoundError):
-                        # Can't read from file, build DataFrame from worksheet directly
-                        # Read headers from first row
-                        headers = []
-                        for col in range(1, self.excel_worksheet.max_column + 1):
-                            cell_value = self.excel_worksheet.cell(row=1, column=col).value
-                            if cell_value:
-                                headers.append(str(cell_value).strip())
-                            else:
-                                break
-                        
-                        # Read data rows
-                        data_rows = []
-                        for row in range(2, self.excel_worksheet.max_row + 1):
-                            row_data = {}
-                            for col_idx, header in enumerate(headers, start=1):
-                                cell_value = self.excel_worksheet.cell(row=row, column=col_idx).value
-                                row_data[header] = cell_value
-                            if any(v is not None for v in row_data.values()):  # Only add non-empty rows
-                                data_rows.append(row_data)
-                        
-                        df = pd.DataFrame(data_rows) if data_rows else pd.DataFrame(columns=headers)
-                
-                # Check if Date column exists
-                if len(df.columns) == 0 or date_column not in df.columns:
-                    # No Date column yet or empty sheet, create new row
-                    new_row_num = 2  # Row 1 is header, row 2 is first data row
-                    print(f"  {CHECKMARK} Creating new row {new_row_num} for date {target_date_str}")
-                    
-                    # Ensure Date column exists
-                    date_col_index = 1
-                    if self.excel_worksheet.max_column == 0 or self.excel_worksheet.cell(row=1, column=1).value != date_column:
-                        date_cell = self.excel_worksheet.cell(row=1, column=date_col_index)
-                        date_cell.value = date_column
-                        # Apply header style
-                        if hasattr(self, 'header_style'):
-                            if self.header_style.get('font'):
-                                date_cell.font = self.header_style['font']
-                            if self.header_style.get('fill'):
-                                date_cell.fill = self.header_style['fill']
-                            if self.header_style.get('alignment'):
-                                date_cell.alignment = self.header_style['alignment']
-                            if self.header_style.get('border'):
-                                date_cell.border = self.header_style['border']
-                    
-                    # Set date value
-                    date_data_cell = self.excel_worksheet.cell(row=new_row_num, column=date_col_index)
-                    date_data_cell.value = target_date
-                    date_data_cell.number_format = 'yyyy-mm-dd'
-                    
-                    return new_row_num
-                
-                # Try to find existing row with this date
-                for idx, row_date in enumerate(df[date_column], start=2):
-                    if pd.notna(row_date):
-                        # Convert Excel date to string for comparison
-                        if isinstance(row_date, pd.Timestamp):
-                            row_date_str = row_date.strftime("%Y-%m-%d")
-                        elif isinstance(row_date, datetime):
-                            row_date_str = row_date.strftime("%Y-%m-%d")
-                        elif isinstance(row_date, str):
-                            try:
-                                row_date_str = pd.to_datetime(row_date).strftime("%Y-%m-%d")
-                            except:
-                                row_date_str = str(row_date).strip()
-                        else:
-                            row_date_str = str(row_date).strip()
-                        
-                        if row_date_str == target_date_str:
-                            print(f"  {CHECKMARK} Found existing row {idx} for date {target_date_str}")
-                            return idx
-                
-                # No existing row found, create new one at the end
-                new_row_num = len(df) + 2  # +1 for header, +1 for new row
-                print(f"  {CHECKMARK} Creating new row {new_row_num} for date {target_date_str}")
-                
-                # Set the date in the date column (always column 1 for test sheet)
-                date_col_index = 1
-                date_cell = self.excel_worksheet.cell(row=new_row_num, column=date_col_index)
-                date_cell.value = target_date
-                date_cell.number_format = 'yyyy-mm-dd'
-                
-                return new_row_num
-            else:
-                # Regular sheet - use existing logic
-                if not self.excel_file_path:
-                    print(f"  {CROSS} Excel file path not set")
-                    return None
-                
-                excel_path = self.excel_file_path
-                df = pd.read_excel(excel_path, sheet_name=self.excel_sheet_name, header=0)
-                
-                if date_column not in df.columns:
-                    print(f"  {CROSS} Date column '{date_column}' not found in Excel sheet")
-                    print(f"     Available columns: {', '.join(df.columns[:10])}...")
-                    return None
-                
-                # Format target date for comparison
-                target_date_str = target_date.strftime("%Y-%m-%d")
-                
-                # Try to find existing row with this date
-                for idx, row_date in enumerate(df[date_column], start=2):
-                    if pd.notna(row_date):
-                        if isinstance(row_date, pd.Timestamp):
-                            row_date_str = row_date.strftime("%Y-%m-%d")
-                        elif isinstance(row_date, datetime):
-                            row_date_str = row_date.strftime("%Y-%m-%d")
-                        elif isinstance(row_date, str):
-                            try:
-                                row_date_str = pd.to_datetime(row_date).strftime("%Y-%m-%d")
-                            except:
-                                row_date_str = str(row_date).strip()
-                        else:
-                            row_date_str = str(row_date).strip()
-                        
-                        if row_date_str == target_date_str:
-                            print(f"  {CHECKMARK} Found existing row {idx} for date {target_date_str}")
-                            return idx
-                
-                # No existing row found, create new one at the end
-                new_row_num = len(df) + 2
-                print(f"  {CHECKMARK} Creating new row {new_row_num} for date {target_date_str}")
-                
-                date_col_index = list(df.columns).index(date_column) + 1
-                date_cell = self.excel_worksheet.cell(row=new_row_num, column=date_col_index)
-                date_cell.value = target_date
-                date_cell.number_format = 'yyyy-mm-dd'
-                
-                return new_row_num
-            
-        except Exception as e:
-            print(f"  {CROSS} Error finding/creating row in Excel: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
-    
-    def update_excel_file(self, row_num: int, data: Dict[str, any]) -> bool:
-        """Update Excel file row with mapped data. Preserves formatting and formulas."""
-        if not row_num or not self.excel_worksheet:
-            print("  Error: Cannot update - row number or worksheet not found")
-            return False
-        
-        try:
-            # Get headers from the first row of the worksheet
-            headers = []
-            for col in range(1, self.excel_worksheet.max_column + 1):
-                cell_value = self.excel_worksheet.cell(row=1, column=col).value
-                if cell_value:
-                    headers.append(str(cell_value).strip())
-                else:
-                    break
-            
-            updates_count = 0
-            skipped_formulas = []
-            
-            # With auto-create enabled, ensure all columns exist first
-            if self.auto_create_columns:
-                # Ensure Date column exists first
-                date_col_name = self.config['google_sheet'].get('date_column', 'Date')
-                if date_col_name in data:
-                    self.ensure_column_exists(date_col_name)
-                
-                # Ensure all other mapped columns exist
-                for sheet_col in data.keys():
-                    if sheet_col != date_col_name:  # Date already handled
-                        self.ensure_column_exists(sheet_col)
-                
-                # Refresh headers after creating columns
-                headers = []
-                for col in range(1, self.excel_worksheet.max_column + 1):
-                    cell_value = self.excel_worksheet.cell(row=1, column=col).value
-                    if cell_value:
-                        headers.append(str(cell_value).strip())
-                    else:
-                        break
-            
-            # Sort data to put Date column first
-            date_col_name = self.config['google_sheet'].get('date_column', 'Date')
-            sorted_data = {}
-            if date_col_name in data:
-                sorted_data[date_col_name] = data[date_col_name]
-            for key, value in data.items():
-                if key != date_col_name:
-                    sorted_data[key] = value
-            
-            for sheet_col, value in sorted_data.items():
-                # Find or create column index
-                col_index = None
-                
-                # Try exact match first
-                try:
-                    col_index = headers.index(sheet_col) + 1  # +1 for Excel 1-based indexing
-                except ValueError:
-                    # Try case-insensitive match
-                    try:
-                        col_index = next(i for i, h in enumerate(headers, 1) if h.lower() == sheet_col.lower())
-                    except StopIteration:
-                        # Column not found
-                        if self.auto_create_columns:
-                            # Auto-create the column
-                            col_index = self.ensure_column_exists(sheet_col, headers)
-                            if col_index:
-                                # Refresh headers after creating column
-                                headers = []
-                                for col in range(1, self.excel_worksheet.max_column + 1):
-                                    cell_value = self.excel_worksheet.cell(row=1, column=col).value
-                                    if cell_value:
-                                        headers.append(str(cell_value).strip())
-                                    else:
-                                        break
-                        else:
-                            print(f"  Warning: Column '{sheet_col}' not found in Excel headers")
-                            continue
-                
-                if not col_index:
-                    continue
-                
-                # Get the cell
-                cell = self.excel_worksheet.cell(row=row_num, column=col_index)
-                
-                # Check if cell has a formula - preserve it if so
-                if cell.value is not None:
-                    if isinstance(cell.value, str) and cell.value.strip().startswith('='):
-                        skipped_formulas.append(sheet_col)
-                        continue
-                    # Also check if cell has a formula in its data_type property
-                    if hasattr(cell, 'data_type') and cell.data_type == 'f':
-                        skipped_formulas.append(sheet_col)
-                        continue
-                
-                # Save current formatting (avoid deprecation warnings)
-                from copy import copy
-                current_font = copy(cell.font) if cell.font else None
-                current_fill = copy(cell.fill) if cell.fill else None
-                current_alignment = copy(cell.alignment) if cell.alignment else None
-                current_border = copy(cell.border) if cell.border else None
-                current_number_format = cell.number_format
-                
-                # Update value
-                if pd.isna(value):
-                    cell.value = None
-                elif isinstance(value, (int, float)):
-                    cell.value = float(value)
-                else:
-                    cell.value = str(value)
-                
-                # Restore formatting
-                if current_font:
-                    cell.font = current_font
-                if current_fill:
-                    cell.fill = current_fill
-                if current_alignment:
-                    cell.alignment = current_alignment
-                if current_border:
-                    cell.border = current_border
-                cell.number_format = current_number_format
-                
-                updates_count += 1
-            
-            # Save the workbook
-            if updates_count > 0 or len(skipped_formulas) > 0:
-                if not self.excel_file_path:
-                    print(f"  {CROSS} Excel file path not set, cannot save")
-                    return False
-                
-                try:
-                    self.workbook.save(self.excel_file_path)
-                    print(f"  {CHECKMARK} Updated {updates_count} columns in Excel row {row_num}")
-                    if skipped_formulas:
-                        print(f"  Note: Skipped {len(skipped_formulas)} columns with formulas: {', '.join(skipped_formulas[:3])}{'...' if len(skipped_formulas) > 3 else ''}")
-                    return True
-                except PermissionError:
-                    print(f"  {WARNING} Could not save Excel file (file may be open in another program)")
-                    print(f"  {WARNING} Please close the Excel file and run the script again to save changes")
-                    print(f"  Note: {updates_count} columns were prepared for update but not saved")
-                    return False
-            else:
-                print("  Warning: No valid updates to perform")
-                return False
-                
-        except Exception as e:
-            print(f"  Error updating Excel file: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-    
-    def update_target(self, row_num: int, data: Dict[str, any], target_date: datetime) -> bool:
-        """Route to either Google Sheets or Excel based on test_mode."""
-        if self.test_mode:
-            return self.update_excel_file(row_num, data)
-        else:
-            return self.update_google_sheet(row_num, data)
-    
     def check_week_ending_exists(self, tab_name: str, week_ending_date: datetime) -> Tuple[bool, int]:
         """Check if Date exists in the tab and return (exists, row_count)."""
         expected_headers = {'date', 'week_ending_date', 'week ending date'}
@@ -2567,21 +2035,20 @@ class CSVToSheetsAutomation:
                 return False, 0
             
             date_col_index = 1
-            for col in range(1, worksheet.max_column + 1):
-                header_val = worksheet.cell(row=1, column=col).value
+            header_row = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            for col_idx, header_val in enumerate(header_row, start=1):
                 if header_val and str(header_val).strip().lower() in expected_headers:
-                    date_col_index = col
+                    date_col_index = col_idx
                     break
             
             # Check all data rows (starting from row 2)
-            for row_idx in range(2, worksheet.max_row + 1):
-                cell_value = worksheet.cell(row=row_idx, column=date_col_index).value
+            for (cell_value,) in worksheet.iter_rows(min_row=2, min_col=date_col_index, max_col=date_col_index, values_only=True):
                 if cell_value is not None:
                     # Convert to string for comparison
                     if isinstance(cell_value, datetime):
-                        cell_str = cell_value.strftime("%Y-%m-%d")
+                        cell_str = cell_value.date().isoformat()
                     elif isinstance(cell_value, pd.Timestamp):
-                        cell_str = cell_value.strftime("%Y-%m-%d")
+                        cell_str = cell_value.date().isoformat()
                     else:
                         try:
                             cell_str = pd.to_datetime(str(cell_value)).strftime("%Y-%m-%d")
@@ -2614,7 +2081,7 @@ class CSVToSheetsAutomation:
 
             # Get all values from the date column
             try:
-                all_values = self._retry_gspread(worksheet.col_values, date_col_index)
+                all_values = self._get_date_column_values(tab_name, worksheet, date_col_index)
                 if len(all_values) <= 1:  # Only header or empty
                     return False, 0
                 
@@ -2680,14 +2147,14 @@ class CSVToSheetsAutomation:
             rows_to_delete = []
             
             # Find rows to delete (starting from row 2, skipping header)
-            for row_idx in range(2, worksheet.max_row + 1):
-                cell_value = worksheet.cell(row=row_idx, column=1).value
+            rows = worksheet.iter_rows(min_row=2, min_col=1, max_col=1, values_only=True)
+            for row_idx, (cell_value,) in enumerate(rows, start=2):
                 if cell_value is not None:
                     # Convert to string for comparison
                     if isinstance(cell_value, datetime):
-                        cell_str = cell_value.strftime("%Y-%m-%d")
+                        cell_str = cell_value.date().isoformat()
                     elif isinstance(cell_value, pd.Timestamp):
-                        cell_str = cell_value.strftime("%Y-%m-%d")
+                        cell_str = cell_value.date().isoformat()
                     else:
                         try:
                             cell_str = pd.to_datetime(str(cell_value)).strftime("%Y-%m-%d")
@@ -2703,6 +2170,8 @@ class CSVToSheetsAutomation:
                 worksheet.delete_rows(row_idx)
                 deleted_count += 1
             
+            if deleted_count:
+                self.invalidate_existing_dates_cache(tab_name)
             return deleted_count
         else:
             # Google Sheets version
@@ -2737,6 +2206,38 @@ class CSVToSheetsAutomation:
             except Exception as e:
                 return 0
             
+            if not rows_to_delete:
+                return 0
+            
+            self.invalidate_existing_dates_cache(tab_name)
+            
+            # Collapse matching rows into contiguous ranges and delete them all in one
+            # batchUpdate (bottom to top so earlier ranges keep their indices)
+            ranges = []
+            for row_idx in rows_to_delete:
+                if ranges and ranges[-1][1] == row_idx - 1:
+                    ranges[-1][1] = row_idx
+                else:
+                    ranges.append([row_idx, row_idx])
+            requests = [
+                {
+                    "deleteDimension": {
+                        "range": {
+                            "sheetId": worksheet.id,
+                            "dimension": "ROWS",
+                            "startIndex": start - 1,
+                            "endIndex": end,
+                        }
+                    }
+                }
+                for start, end in reversed(ranges)
+            ]
+            try:
+                self._retry_gspread(self.sheet.batch_update, {"requests": requests})
+                return len(rows_to_delete)
+            except Exception as e:
+                print(f"      {WARNING} Batch delete failed, deleting rows one by one: {e}")
+            
             # Delete rows in reverse order (from bottom to top) to avoid index shifting issues
             deleted_count = 0
             for row_idx in reversed(rows_to_delete):
@@ -2748,16 +2249,18 @@ class CSVToSheetsAutomation:
             
             return deleted_count
     
+    def _read_excel_headers(self, worksheet) -> List[str]:
+        """Header names from row 1 of an Excel worksheet, up to the first empty cell."""
+        headers = []
+        for value in next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ()):
+            if not value:
+                break
+            headers.append(str(value).strip())
+        return headers
+
     def _column_index_to_a1(self, col_idx: int) -> str:
         """Convert column index (1-based) to A1 notation (e.g., 1 -> A, 2 -> B, 27 -> AA)."""
-        import string
-        col_letter = ''
-        col_num = col_idx
-        while col_num > 0:
-            col_num -= 1
-            col_letter = string.ascii_uppercase[col_num % 26] + col_letter
-            col_num //= 26
-        return col_letter
+        return _column_letter(col_idx)
 
     def _filter_total_rows(self, df: pd.DataFrame, csv_file: Path) -> pd.DataFrame:
         """Remove rows where the first column contains a Total marker."""
@@ -2823,6 +2326,7 @@ class CSVToSheetsAutomation:
                 if header_lower in ['job title', 'job_title']:
                     job_title_col_idx = col_idx
             if clasification_col_idx and job_title_col_idx:
+                from openpyxl.utils import get_column_letter
                 job_title_col_letter = get_column_letter(job_title_col_idx)
                 formula = (
                     f'=IFERROR(VLOOKUP({job_title_col_letter}{start_row}, '
@@ -2832,6 +2336,7 @@ class CSVToSheetsAutomation:
                 clasification_cell.value = formula
                 print(f"      {CHECKMARK} Added formula to Clasification column for 1 row")
 
+        self.invalidate_existing_dates_cache(tab_name)
         print(f"      {WARNING} CSV empty; inserted zero row for {tab_name}")
         return True
 
@@ -2841,10 +2346,7 @@ class CSVToSheetsAutomation:
             return False
         row_values = self._build_empty_row_values(headers, week_ending_date, for_google=True)
 
-        all_values = self._retry_gspread(worksheet.get_all_values)
-        start_row = 2 if not all_values or len(all_values) <= 1 else len(all_values) + 1
-        self._retry_gspread(worksheet.append_rows, [row_values], value_input_option='USER_ENTERED')
-
+        formula_added = False
         if tab_name == "Labor_Input":
             clasification_col_idx = None
             job_title_col_idx = None
@@ -2855,20 +2357,19 @@ class CSVToSheetsAutomation:
                 if header_lower in ['job title', 'job_title']:
                     job_title_col_idx = col_idx
             if clasification_col_idx and job_title_col_idx:
+                all_values = self._retry_gspread(worksheet.get_all_values)
+                start_row = 2 if not all_values or len(all_values) <= 1 else len(all_values) + 1
                 job_title_col_letter = self._column_index_to_a1(job_title_col_idx)
-                clasification_col_letter = self._column_index_to_a1(clasification_col_idx)
-                formula = (
+                row_values[clasification_col_idx - 1] = (
                     f'=IFERROR(VLOOKUP({job_title_col_letter}{start_row}, '
                     f'Job_Classification_Lookup!$A$2:$B$100, 2, FALSE), "Other")'
                 )
-                cell_range = f"{clasification_col_letter}{start_row}"
-                self._retry_gspread(
-                    worksheet.update,
-                    range_name=cell_range,
-                    values=[[formula]],
-                    value_input_option='USER_ENTERED'
-                )
-                print(f"      {CHECKMARK} Added formula to Clasification column for 1 row")
+                formula_added = True
+
+        self._retry_gspread(worksheet.append_rows, [row_values], value_input_option='USER_ENTERED')
+        self.invalidate_existing_dates_cache(tab_name)
+        if formula_added:
+            print(f"      {CHECKMARK} Added formula to Clasification column for 1 row")
 
         print(f"      {WARNING} CSV empty; inserted zero row for {tab_name}")
         return True
@@ -2900,13 +2401,7 @@ class CSVToSheetsAutomation:
                     return self._append_empty_row_excel(worksheet, tab_name, excel_headers, week_ending_date)
                 
                 # Get Excel headers (row 1)
-                excel_headers = []
-                for col in range(1, worksheet.max_column + 1):
-                    header_cell = worksheet.cell(row=1, column=col).value
-                    if header_cell:
-                        excel_headers.append(str(header_cell).strip())
-                    else:
-                        break
+                excel_headers = self._read_excel_headers(worksheet)
                 
                 if not excel_headers:
                     print(f"  {CROSS} No headers found in tab '{tab_name}'")
@@ -2966,25 +2461,29 @@ class CSVToSheetsAutomation:
                 else:
                     start_row = worksheet.max_row + 1
                 
-                # Append each row from CSV
+                # Resolve CSV positions and Excel column indexes once, not per cell.
+                # A repeated CSV header resolves to its first column (get_loc would give a slice/mask)
+                csv_positions = {}
+                for csv_pos, csv_col in enumerate(df.columns):
+                    csv_positions.setdefault(csv_col, csv_pos)
+                column_targets = []
+                for csv_col, excel_col in csv_to_excel_mapping.items():
+                    if excel_col in excel_headers:
+                        column_targets.append((csv_col, csv_positions[csv_col], excel_headers.index(excel_col) + 1))  # Excel is 1-based
+                
+                # Append each row from CSV (plain tuples; iterrows builds a Series per row)
                 rows_appended = 0
-                for idx, csv_row in df.iterrows():
+                for csv_values in df.itertuples(index=False, name=None):
                     row_num = start_row + rows_appended
                     
                     # Write data to Excel row, matching columns
-                    for csv_col, excel_col in csv_to_excel_mapping.items():
-                        # Find Excel column index
-                        try:
-                            col_idx = excel_headers.index(excel_col) + 1  # Excel is 1-based
-                        except ValueError:
-                            continue  # Skip if column not found
-                        
+                    for csv_col, csv_pos, col_idx in column_targets:
                         # Get value from CSV
                         if csv_col == self.date_column_name:
                             # Use date only (no time) for the input date
-                            value = week_ending_date.date() if hasattr(week_ending_date, 'date') else week_ending_date
+                            value = date_only
                         else:
-                            value = csv_row[csv_col]
+                            value = csv_values[csv_pos]
                         
                         # Write to cell
                         cell = worksheet.cell(row=row_num, column=col_idx)
@@ -3028,12 +2527,13 @@ class CSVToSheetsAutomation:
                                 break
                         
                         if job_title_col_idx:
+                            from openpyxl.utils import get_column_letter
+                            job_title_col_letter = get_column_letter(job_title_col_idx)
                             # Add formula to each new row
                             for i in range(rows_appended):
                                 row_num = start_row + i
                                 # Formula: =IFERROR(VLOOKUP(C{row_num}, Job_Classification_Lookup!$A$2:$B$100, 2, FALSE), "Other")
                                 # Where C{row_num} is the Job Title column at current row
-                                job_title_col_letter = get_column_letter(job_title_col_idx)
                                 formula = f'=IFERROR(VLOOKUP({job_title_col_letter}{row_num}, Job_Classification_Lookup!$A$2:$B$100, 2, FALSE), "Other")'
                                 clasification_cell = worksheet.cell(row=row_num, column=clasification_col_idx)
                                 clasification_cell.value = formula
@@ -3042,6 +2542,7 @@ class CSVToSheetsAutomation:
                 
                 # Return True for all tabs after successfully appending rows
                 if rows_appended > 0:
+                    self.invalidate_existing_dates_cache(tab_name)
                     return True
                 else:
                     print(f"  {WARNING} No rows to append from CSV file")
@@ -3065,7 +2566,7 @@ class CSVToSheetsAutomation:
                 except gspread.exceptions.WorksheetNotFound:
                     print(f"  {CROSS} Tab '{tab_name}' does not exist in Google Sheet")
                     try:
-                        sheet_titles = [ws.title for ws in self._retry_gspread(self.sheet.worksheets)]
+                        sheet_titles = self._load_worksheet_index()
                         print(f"     Available tabs: {', '.join(sheet_titles)}")
                     except:
                         pass
@@ -3133,89 +2634,86 @@ class CSVToSheetsAutomation:
                 else:
                     start_row = len(all_values) + 1
                 
-                # Prepare data rows for batch update
+                # Find the CSV column that maps to each sheet column once, not per row
+                sheet_to_csv = {}
+                for csv_key, sheet_val in csv_to_sheet_mapping.items():
+                    sheet_to_csv.setdefault(sheet_val, csv_key)
+                # A repeated CSV header resolves to its first column (get_loc would give a slice/mask)
+                csv_positions = {}
+                for csv_pos, csv_col in enumerate(df.columns):
+                    csv_positions.setdefault(csv_col, csv_pos)
+                column_sources = []
+                for sheet_col in sheet_headers:
+                    csv_col = sheet_to_csv.get(sheet_col)
+                    column_sources.append((csv_col, csv_positions[csv_col] if csv_col else None))
+                
+                # Prepare data rows for batch update (plain tuples; iterrows builds a Series per row)
                 rows_to_append = []
-                for idx, csv_row in df.iterrows():
+                for csv_values in df.itertuples(index=False, name=None):
                     row_data = []
                     # Build row data matching sheet column order
-                    for sheet_col in sheet_headers:
-                        if sheet_col in csv_to_sheet_mapping.values():
-                            # Find the CSV column that maps to this sheet column
-                            csv_col = None
-                            for csv_key, sheet_val in csv_to_sheet_mapping.items():
-                                if sheet_val == sheet_col:
-                                    csv_col = csv_key
-                                    break
+                    for csv_col, csv_pos in column_sources:
+                        if csv_col:
+                            if csv_col == self.date_column_name:
+                                value = date_only
+                            else:
+                                value = csv_values[csv_pos]
                             
-                            if csv_col:
-                                if csv_col == self.date_column_name:
-                                    value = week_ending_date.date() if hasattr(week_ending_date, 'date') else week_ending_date
-                                else:
-                                    value = csv_row[csv_col]
-                                
-                                # Convert value to appropriate format
-                                if pd.isna(value):
-                                    row_data.append("")
-                                elif csv_col == self.date_column_name:
-                                    from datetime import date as date_type
-                                    if isinstance(value, datetime):
-                                        row_data.append(value.date().strftime("%Y-%m-%d"))
-                                    elif isinstance(value, date_type):
-                                        row_data.append(value.strftime("%Y-%m-%d"))
-                                    else:
-                                        try:
-                                            row_data.append(pd.to_datetime(value).date().strftime("%Y-%m-%d"))
-                                        except:
-                                            row_data.append(str(value))
-                                elif isinstance(value, (int, float)):
-                                    row_data.append(float(value))
+                            # Convert value to appropriate format
+                            if pd.isna(value):
+                                row_data.append("")
+                            elif csv_col == self.date_column_name:
+                                from datetime import date as date_type
+                                if isinstance(value, datetime):
+                                    row_data.append(value.date().isoformat())
+                                elif isinstance(value, date_type):
+                                    row_data.append(value.isoformat())
                                 else:
-                                    row_data.append(str(value))
+                                    try:
+                                        row_data.append(pd.to_datetime(value).date().strftime("%Y-%m-%d"))
+                                    except:
+                                        row_data.append(str(value))
+                            elif isinstance(value, (int, float)):
+                                row_data.append(float(value))
                             else:
-                                row_data.append("")  # Empty cell for unmapped columns
+                                row_data.append(str(value))
                         else:
                             row_data.append("")  # Empty cell for columns not in mapping
                     rows_to_append.append(row_data)
                 
-                # Batch append rows to Google Sheets
-                if rows_to_append:
-                    self._retry_gspread(worksheet.append_rows, rows_to_append, value_input_option='USER_ENTERED')
-                    rows_appended = len(rows_to_append)
+                # Add formula to Clasification column for all new rows (only for Labor_Input tab).
+                # Formulas ride along in the same append request instead of one update call per row.
+                formulas_added = False
+                if tab_name == "Labor_Input" and rows_to_append:
+                    clasification_col_idx = None
+                    for col_idx, header in enumerate(sheet_headers, start=1):
+                        if header.lower() in ['clasification', 'classification']:
+                            clasification_col_idx = col_idx
+                            break
                     
-                    # Add formula to Clasification column for all newly appended rows (only for Labor_Input tab)
-                    if tab_name == "Labor_Input" and rows_appended > 0:
-                        clasification_col_idx = None
+                    if clasification_col_idx:
+                        # Find Job Title column
+                        job_title_col_idx = None
                         for col_idx, header in enumerate(sheet_headers, start=1):
-                            if header.lower() in ['clasification', 'classification']:
-                                clasification_col_idx = col_idx
+                            if header.lower() in ['job title', 'job_title']:
+                                job_title_col_idx = col_idx
                                 break
                         
-                        if clasification_col_idx:
-                            # Find Job Title column
-                            job_title_col_idx = None
-                            for col_idx, header in enumerate(sheet_headers, start=1):
-                                if header.lower() in ['job title', 'job_title']:
-                                    job_title_col_idx = col_idx
-                                    break
-                            
-                            if job_title_col_idx:
-                                # Add formula to each new row
-                                job_title_col_letter = self._column_index_to_a1(job_title_col_idx)
-                                clasification_col_letter = self._column_index_to_a1(clasification_col_idx)
-                                
-                                for i in range(rows_appended):
-                                    row_num = start_row + i
-                                    # Formula: =IFERROR(VLOOKUP(C{row_num}, Job_Classification_Lookup!$A$2:$B$100, 2, FALSE), "Other")
-                                    formula = f'=IFERROR(VLOOKUP({job_title_col_letter}{row_num}, Job_Classification_Lookup!$A$2:$B$100, 2, FALSE), "Other")'
-                                    cell_range = f"{clasification_col_letter}{row_num}"
-                                    self._retry_gspread(
-                                        worksheet.update,
-                                        range_name=cell_range,
-                                        values=[[formula]],
-                                        value_input_option='USER_ENTERED'
-                                    )
-                                
-                                print(f"      {CHECKMARK} Added formula to Clasification column for {rows_appended} row(s)")
+                        if job_title_col_idx:
+                            job_title_col_letter = self._column_index_to_a1(job_title_col_idx)
+                            for i, row_data in enumerate(rows_to_append):
+                                row_num = start_row + i
+                                # Formula: =IFERROR(VLOOKUP(C{row_num}, Job_Classification_Lookup!$A$2:$B$100, 2, FALSE), "Other")
+                                row_data[clasification_col_idx - 1] = f'=IFERROR(VLOOKUP({job_title_col_letter}{row_num}, Job_Classification_Lookup!$A$2:$B$100, 2, FALSE), "Other")'
+                            formulas_added = True
+                
+                # Batch append rows to Google Sheets (single request)
+                if rows_to_append:
+                    self._append_rows_batched(worksheet, rows_to_append)
+                    self.invalidate_existing_dates_cache(tab_name)
+                    rows_appended = len(rows_to_append)
+                    if formulas_added:
+                        print(f"      {CHECKMARK} Added formula to Clasification column for {rows_appended} row(s)")
                     
                     # Success message is handled by calling function
                     return True
@@ -3261,13 +2759,12 @@ class CSVToSheetsAutomation:
                 found_path = None
                 
                 # Check subdirectories (exclude backup files)
-                for subdir in base_path.iterdir():
-                    if subdir.is_dir():
-                        potential_path = subdir / self.excel_file
-                        # Skip backup files
-                        if potential_path.exists() and "backup" not in potential_path.name.lower():
-                            found_path = potential_path
-                            break
+                for subdir in self._list_directory(base_path, dirs=True):
+                    potential_path = subdir / self.excel_file
+                    # Skip backup files
+                    if potential_path.exists() and "backup" not in potential_path.name.lower():
+                        found_path = potential_path
+                        break
                 
                 if found_path:
                     excel_path = found_path
@@ -3343,42 +2840,58 @@ class CSVToSheetsAutomation:
             print(f"\n  {CHECKMARK} Configuration validation complete!")
         return True
     
+    def _prepare_target(self, skip_validation: bool = False) -> bool:
+        """Validate the configuration (unless the caller already did) and open the target:
+        the Excel workbook in test mode, the Google Sheet otherwise. Production dry
+        runs do not authenticate, since they make no API calls."""
+        if not skip_validation:
+            print_banner("VALIDATION")
+            if not self.validate_configuration():
+                print(f"\n{WARNING} Configuration validation failed. Please fix errors above.")
+                return False
+        
+        if self.test_mode:
+            # Loaded even in dry run mode to see which dates already exist
+            if (not skip_validation or not self.workbook) and not self.load_excel_file():
+                print(f"\n{WARNING} Failed to load Excel file. Exiting.")
+                return False
+        elif not self.dry_run:
+            if not self.authenticate_google_sheets():
+                print(f"\n{WARNING} Failed to authenticate Google Sheets. Exiting.")
+                return False
+        return True
+    
+    def _print_dry_run_plan(self, include_sales: bool = True, include_labor: bool = True) -> None:
+        """Describe a production run without calling Drive or Sheets (no credentials in dry run)."""
+        print(f"\n  [DRY RUN] Production plan (no Google API calls made):")
+        print(f"    Target Google Sheet: {self.config['google_sheet'].get('sheet_id', '')}")
+        if include_sales:
+            print(f"    Sales_Input Drive folder: {self.drive_sales_input_id}")
+            for csv_name, tab_name in self.csv_to_tab_mapping.items():
+                print(f"      {csv_name} -> Tab: {tab_name}")
+        if include_labor:
+            print(f"    Labor_Input Drive folder: {self.drive_labor_input_id}")
+            print(f"      PayrollExport_*.csv -> Tab: Labor_Input")
+    
     def process_csv_files(self, skip_validation: bool = False) -> None:
         """Main processing function - finds and processes all CSV files."""
-        if not skip_validation:
-            if self.dry_run:
-                print("\n" + "="*70)
-                print("VALIDATION")
-                print("="*70)
-                if not self.validate_configuration():
-                    print(f"\n{WARNING} Configuration validation failed. Please fix errors above.")
-                    return
-            else:
-                print("\n" + "="*70)
-                print("VALIDATION")
-                print("="*70)
-                if not self.validate_configuration():
-                    print(f"\n{WARNING} Configuration validation failed. Please fix errors above.")
-                    return
-                
-                # Load appropriate target based on test mode
-                if self.test_mode:
-                    if not self.load_excel_file():
-                        print(f"\n{WARNING} Failed to load Excel file. Exiting.")
-                        return
-                else:
-                    if not self.authenticate_google_sheets():
-                        return
-        elif not self.test_mode or not self.workbook:
-            # If skipping validation but Excel not loaded, load it
-            if self.test_mode and not self.workbook:
-                if not self.load_excel_file():
-                    print(f"\n{WARNING} Failed to load Excel file. Exiting.")
-                    return
+        try:
+            self._process_csv_files(skip_validation)
+        finally:
+            # One workbook save for the whole step, even if it stopped early
+            if not self.flush_workbook():
+                print(f"\n  {CROSS} Sales step FAILED: its changes were not saved to the Excel file")
+    
+    def _process_csv_files(self, skip_validation: bool) -> None:
+        """Sales step body; the Excel workbook is saved by process_csv_files."""
+        if not self._prepare_target(skip_validation):
+            return
         
-        print("\n" + "="*70)
-        print("PROCESSING SALES CSV FILES")
-        print("="*70)
+        if self.dry_run and not self.test_mode:
+            self._print_dry_run_plan(include_labor=False)
+            return
+        
+        print_banner("PROCESSING SALES CSV FILES")
         
         # Determine which folders/dates to process
         if self.test_mode:
@@ -3444,36 +2957,57 @@ class CSVToSheetsAutomation:
                 print("\n  [SKIP] User chose not to process sales dates.\n")
                 return
 
+        # Download every selected week folder from Drive at once; each sync is I/O bound
+        folder_downloads = {}
+        download_pool = None
+        if not self.test_mode and len(folders_to_process) > 1:
+            download_pool = ThreadPoolExecutor(max_workers=min(len(folders_to_process), 4))
+            for folder_id, folder_name, _ in folders_to_process:
+                folder_downloads[folder_id] = download_pool.submit(
+                    self._prepare_sales_input_folder_from_drive, folder_id, folder_name
+                )
+
         sales_plan = []
-        for folder_entry in folders_to_process:
-            if self.test_mode:
-                folder_path, input_date = folder_entry
-            else:
-                folder_id, folder_name, input_date = folder_entry
-                folder_path = self._prepare_sales_input_folder_from_drive(folder_id, folder_name)
+        try:
+            for folder_entry in folders_to_process:
+                if self.test_mode:
+                    folder_path, input_date = folder_entry
+                else:
+                    folder_id, folder_name, input_date = folder_entry
+                    if folder_id in folder_downloads:
+                        folder_path = folder_downloads[folder_id].result()
+                    else:
+                        folder_path = self._prepare_sales_input_folder_from_drive(folder_id, folder_name)
 
-            if not folder_path.exists():
-                print(f"\n  {WARNING} Folder does not exist: {folder_path}")
-                continue
+                if not folder_path.exists():
+                    print(f"\n  {WARNING} Folder does not exist: {folder_path}")
+                    continue
 
-            csv_files = self.find_csv_files(folder_path)
-            if not csv_files:
-                continue
+                csv_files = self.find_csv_files(folder_path)
+                if not csv_files:
+                    continue
 
-            files_to_process = []
-            for csv_file in csv_files:
-                if csv_file.name in self.csv_to_tab_mapping:
-                    files_to_process.append(csv_file)
+                files_to_process = []
+                for csv_file in csv_files:
+                    if csv_file.name in self.csv_to_tab_mapping:
+                        files_to_process.append(csv_file)
 
-            if not files_to_process:
-                print(f"\n  {CROSS} No CSV files found matching the required files:")
-                for csv_name in self.csv_to_tab_mapping.keys():
-                    print(f"      - {csv_name}")
-                continue
+                if not files_to_process:
+                    print(f"\n  {CROSS} No CSV files found matching the required files:")
+                    for csv_name in self.csv_to_tab_mapping.keys():
+                        print(f"      - {csv_name}")
+                    continue
 
-            sales_plan.append((folder_path, input_date, files_to_process))
+                sales_plan.append((folder_path, input_date, files_to_process))
+        finally:
+            if download_pool:
+                # Normally every sync has finished by now; after an error, stop
+                # the queued ones and wait for those still writing to the cache
+                download_pool.shutdown(wait=True, cancel_futures=True)
 
         total_sales_files = sum(len(files) for _, _, files in sales_plan)
+        # Parse every planned file in one pool so all cores are used, not just one folder's worth
+        self._prefetch_csv_files([csv_file for _, _, files in sales_plan for csv_file in files])
         sales_progress = 0
         render_progress("Sales", sales_progress, total_sales_files)
 
@@ -3510,7 +3044,7 @@ class CSVToSheetsAutomation:
                         self._get_worksheet(tab_name)  # Check if worksheet exists
                     except gspread.exceptions.WorksheetNotFound:
                         try:
-                            sheet_titles = [ws.title for ws in self.sheet.worksheets()]
+                            sheet_titles = self._load_worksheet_index()
                             print(f"  {CROSS} Tab '{tab_name}' does not exist in Google Sheet")
                             print(f"     Available tabs: {', '.join(sheet_titles)}")
                         except:
@@ -3544,13 +3078,9 @@ class CSVToSheetsAutomation:
                     
                     if success:
                         if self.test_mode:
-                            # Save workbook
-                            try:
-                                self.workbook.save(self.excel_file_path)
-                                print(f"      {CHECKMARK} Completed and saved\n")
-                            except PermissionError:
-                                print(f"      {WARNING} Could not save Excel file (file may be open)")
-                                print(f"      {WARNING} Please close the Excel file and run the script again to save changes\n")
+                            # Saved once when this step finishes (flush_workbook)
+                            self._workbook_dirty = True
+                            print(f"      {CHECKMARK} Prepared (saved when this step finishes)\n")
                         else:
                             # Google Sheets - changes are saved automatically
                             print(f"      {CHECKMARK} Completed\n")
@@ -3559,6 +3089,9 @@ class CSVToSheetsAutomation:
 
                 sales_progress += 1
                 render_progress("Sales", sales_progress, total_sales_files)
+        
+        # Drop parsed files the user chose to skip
+        self._discard_csv_prefetch()
     
     def ask_user_which_file_to_process(self, latest_file: Path, duplicate_files: List[Path], week_ending_date: datetime) -> Optional[Path]:
         """Ask user which file to process when multiple files exist for the same input date."""
@@ -3588,39 +3121,21 @@ class CSVToSheetsAutomation:
     
     def process_labor_input_csv_files(self, skip_validation: bool = False) -> None:
         """Process PayrollExport CSV files from Labor_Input folder."""
-        if not skip_validation:
-            if self.dry_run:
-                print("\n" + "="*70)
-                print("VALIDATION")
-                print("="*70)
-                if not self.validate_configuration():
-                    print(f"\n{WARNING} Configuration validation failed. Please fix errors above.")
-                    return
-            else:
-                print("\n" + "="*70)
-                print("VALIDATION")
-                print("="*70)
-                if not self.validate_configuration():
-                    print(f"\n{WARNING} Configuration validation failed. Please fix errors above.")
-                    return
-            
-            # Load appropriate file based on test mode
-            if self.test_mode:
-                # Load Excel file (even in dry run mode to validate tab exists)
-                if not self.load_excel_file():
-                    print(f"\n{WARNING} Failed to load Excel file. Exiting.")
-                    return
-            else:
-                # Load Google Sheet
-                if not self.authenticate_google_sheets():
-                    print(f"\n{WARNING} Failed to authenticate Google Sheets. Exiting.")
-                    return
-        elif not self.test_mode or not self.workbook:
-            # If skipping validation but Excel not loaded, load it
-            if self.test_mode and not self.workbook:
-                if not self.load_excel_file():
-                    print(f"\n{WARNING} Failed to load Excel file. Exiting.")
-                    return
+        try:
+            self._process_labor_input_csv_files(skip_validation)
+        finally:
+            # One workbook save for the whole step, even if it stopped early
+            if not self.flush_workbook():
+                print(f"\n  {CROSS} Labor step FAILED: its changes were not saved to the Excel file")
+    
+    def _process_labor_input_csv_files(self, skip_validation: bool) -> None:
+        """Labor step body; the Excel workbook is saved by process_labor_input_csv_files."""
+        if not self._prepare_target(skip_validation):
+            return
+        
+        if self.dry_run and not self.test_mode:
+            self._print_dry_run_plan(include_sales=False)
+            return
         
         # Get Labor_Input folder path
         if self.test_mode:
@@ -3629,11 +3144,10 @@ class CSVToSheetsAutomation:
         else:
             labor_input_folder = self._prepare_labor_input_folder_from_drive()
         
-        print("\n" + "="*70)
-        print("PROCESSING LABOR INPUT CSV FILES")
-        print("="*70)
+        print_banner("PROCESSING LABOR INPUT CSV FILES")
         
         # Determine which labor files to process
+        self._preload_sheet_state(["Labor_Input"])
         if self.process_oldest:
             # Find all missing dates (oldest first)
             missing_files = self.find_missing_labor_csvs(labor_input_folder)
@@ -3663,6 +3177,8 @@ class CSVToSheetsAutomation:
                 print("\n  [SKIP] User chose not to process labor dates.\n")
                 return
 
+        self._prefetch_csv_files([file_to_process for file_to_process, _, _ in files_to_process])
+        
         total_labor_files = len(files_to_process)
         labor_progress = 0
         render_progress("Labor", labor_progress, total_labor_files)
@@ -3681,10 +3197,9 @@ class CSVToSheetsAutomation:
                 return
             try:
                 self._get_worksheet(tab_name)  # Check if worksheet exists
-                self._get_worksheet(tab_name)  # Check if worksheet exists
             except gspread.exceptions.WorksheetNotFound:
                 try:
-                    sheet_titles = [ws.title for ws in self.sheet.worksheets()]
+                    sheet_titles = self._load_worksheet_index()
                     print(f"\n  {CROSS} Tab '{tab_name}' does not exist in Google Sheet")
                     print(f"     Available tabs: {', '.join(sheet_titles)}")
                 except:
@@ -3731,13 +3246,9 @@ class CSVToSheetsAutomation:
                 
                 if success:
                     if self.test_mode:
-                        # Save workbook
-                        try:
-                            self.workbook.save(self.excel_file_path)
-                            print(f"      {CHECKMARK} Completed and saved\n")
-                        except PermissionError:
-                            print(f"      {WARNING} Could not save Excel file (file may be open)")
-                            print(f"      {WARNING} Please close the Excel file and run the script again to save changes\n")
+                        # Saved once when this step finishes (flush_workbook)
+                        self._workbook_dirty = True
+                        print(f"      {CHECKMARK} Prepared (saved when this step finishes)\n")
                     else:
                         # Google Sheets - changes are saved automatically
                         print(f"      {CHECKMARK} Completed\n")
@@ -3746,62 +3257,62 @@ class CSVToSheetsAutomation:
 
             labor_progress += 1
             render_progress("Labor", labor_progress, total_labor_files)
+        
+        self._discard_csv_prefetch()
     
     def process_all_csv_files(self) -> None:
         """Process both Sales Input CSV files and Labor_Input CSV files."""
-        print("\n" + "="*70)
-        print("PROCESSING ALL CSV FILES")
-        print("="*70)
-        print("  • Sales Input CSV Files")
-        print("  • Labor Input CSV Files")
-        
-        # Validate once at the beginning
-        if self.dry_run:
-            print("\n" + "="*70)
-            print("VALIDATION")
-            print("="*70)
-            if not self.validate_configuration():
-                print(f"\n{WARNING} Configuration validation failed. Please fix errors above.")
-                return
-        else:
-            print("\n" + "="*70)
-            print("VALIDATION")
-            print("="*70)
-            if not self.validate_configuration():
-                print(f"\n{WARNING} Configuration validation failed. Please fix errors above.")
-                return
-            
-            # Load Excel file if in test mode
-            if self.test_mode:
-                if not self.load_excel_file():
-                    print(f"\n{WARNING} Failed to load Excel file. Exiting.")
-                    return
-            else:
-                if not self.authenticate_google_sheets():
-                    return
+        print_banner("PROCESSING ALL CSV FILES", "  • Sales Input CSV Files", "  • Labor Input CSV Files")
+        
+        # Validate and open the target once for both steps
+        if not self._prepare_target():
+            return
+        
+        if self.dry_run and not self.test_mode:
+            self._print_dry_run_plan()
+            return
+        
+        # Read every tab's week state up front for both steps
+        self._preload_sheet_state(list(self.csv_to_tab_mapping.values()) + ["Labor_Input"])
+        
+        # Download Labor_Input from Drive in the background while Sales runs.
+        # Sales and Labor themselves stay sequential: both prompt the user, so
+        # the download's messages are collected and shown after the Sales step.
+        labor_messages = []
+        labor_error = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            labor_prefetch = None
+            if not self.test_mode and self.creds:
+                labor_prefetch = executor.submit(self._prepare_labor_input_folder_from_drive, labor_messages.append)
+            
+            # Process Sales Input CSV files first (skip validation since we already did it)
+            print_banner("STEP 1: SALES INPUT CSV FILES")
+            self.process_csv_files(skip_validation=True)
+            
+            if labor_prefetch:
+                try:
+                    labor_prefetch.result()
+                except Exception as e:
+                    labor_error = e
         
-        # Process Sales Input CSV files first (skip validation since we already did it)
-        print("\n" + "="*70)
-        print("STEP 1: SALES INPUT CSV FILES")
-        print("="*70)
-        self.process_csv_files(skip_validation=True)
+        if labor_messages:
+            print()
+            for message in labor_messages:
+                print(message)
+        if labor_error:
+            # Labor step will retry the download itself
+            print(f"\n  {WARNING} Background Labor_Input download failed: {labor_error}")
         
         # Process Labor Input CSV files (skip validation since we already did it)
-        print("\n" + "="*70)
-        print("STEP 2: LABOR INPUT CSV FILES")
-        print("="*70)
+        print_banner("STEP 2: LABOR INPUT CSV FILES")
         self.process_labor_input_csv_files(skip_validation=True)
         
-        print("\n" + "="*70)
-        print("ALL PROCESSING COMPLETE!")
-        print("="*70)
+        print_banner("ALL PROCESSING COMPLETE!")
 
 def show_interactive_menu(show_all: bool = False) -> Tuple[str, str, str]:
     """Show interactive menu and return user's choices.
     Returns: (process_type, week_type, mode_type)"""
-    print("\n" + "="*70)
-    print("CSV TO SHEETS AUTOMATION - INTERACTIVE MENU")
-    print("="*70)
+    print_banner("CSV TO SHEETS AUTOMATION - INTERACTIVE MENU")
     print("\nSelect an option:")
     print()
     if show_all:
@@ -3828,57 +3339,24 @@ def show_interactive_menu(show_all: bool = False) -> Tuple[str, str, str]:
         print("   11. All + Latest + Production")
         print()
     
-    while True:
-        try:
-            prompt = "Enter your choice (1-12): " if show_all else "Enter your choice (11): "
+    prompt = "Enter your choice (1-12): " if show_all else "Enter your choice (11): "
+    out_of_range = "  Please enter a number between 1 and 12" if show_all else "  Please enter 11"
+    try:
+        while True:
             choice = input(prompt).strip()
+            if not choice.isdecimal():
+                print("  Please enter a valid number")
+                continue
             choice_num = int(choice)
-            
-            if choice_num == 1:
-                return ("sales", "latest", "testing")
-            elif choice_num == 2:
-                return ("sales", "oldest", "testing")
-            elif choice_num == 3:
-                return ("sales", "latest", "production")
-            elif choice_num == 4:
-                return ("sales", "oldest", "production")
-            elif choice_num == 5:
-                return ("labor", "latest", "testing")
-            elif choice_num == 6:
-                return ("labor", "oldest", "testing")
-            elif choice_num == 7:
-                return ("labor", "latest", "production")
-            elif choice_num == 8:
-                return ("labor", "oldest", "production")
-            elif choice_num == 9:
-                return ("all", "latest", "testing")
-            elif choice_num == 10:
-                return ("all", "oldest", "testing")
-            elif choice_num == 11:
-                return ("all", "latest", "production")
-            elif choice_num == 12:
-                return ("all", "oldest", "production")
-            else:
-                if show_all:
-                    print("  Please enter a number between 1 and 12")
-                else:
-                    print("  Please enter 11")
-        except ValueError:
-            print("  Please enter a valid number")
-        except KeyboardInterrupt:
-            print("\n\nExiting...")
-            sys.exit(0)
-
-def main():
-    """Main entry point."""
-    import argparse
-    import sys
-    
-    show_all_menu = False
-    if any(arg.lower() in ("help", "help.") for arg in sys.argv[1:]):
-        show_all_menu = True
-        sys.argv = [arg for arg in sys.argv if arg.lower() not in ("help", "help.")]
-    
+            if 1 <= choice_num <= len(MENU_CHOICES):
+                return MENU_CHOICES[choice_num - 1]
+            print(out_of_range)
+    except (KeyboardInterrupt, EOFError):
+        print("\n\nExiting...")
+        sys.exit(0)
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(description='CSV to Google Sheets Automation')
     parser.add_argument('--dry-run', action='store_true', 
                        help='Validate configuration and show what would be uploaded without actually uploading')
@@ -3910,8 +3388,17 @@ def main():
                            help='Use testing mode (Excel file)')
     mode_group.add_argument('--prod', action='store_true',
                            help='Use production mode (Google Sheets)')
+    return parser
+
+
+def main():
+    """Main entry point."""
+    show_all_menu = False
+    if any(arg.lower() in ("help", "help.") for arg in sys.argv[1:]):
+        show_all_menu = True
+        sys.argv = [arg for arg in sys.argv if arg.lower() not in ("help", "help.")]
     
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
     
     # Handle deprecated --labor-input flag
     if args.labor_input:
@@ -3944,7 +3431,8 @@ def main():
         mode_type = False  # production mode
     # else: None (use config.json)
     
-    # If no process type specified, show interactive menu
+    # If no process type specified, show interactive menu. Without a terminal the
+    # choice is read from stdin (e.g. `echo 1 | ...`); no input exits without processing.
     if process_type is None:
         process_type, week_type, mode_type_str = show_interactive_menu(show_all=show_all_menu)
         mode_type = True if mode_type_str == "testing" else False